@@ -9,7 +9,9 @@ This module provides a centralized caching layer that:
 
 import asyncio
 import contextlib
+import logging
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -21,16 +23,24 @@ from sense_pulse.web.log_handler import get_structured_logger
 logger = get_structured_logger(__name__, component="cache")
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedData:
     """Container for cached data with timestamp."""
 
     data: Any
     timestamp: float = field(default_factory=time.time)
 
-    def is_expired(self, ttl: float) -> bool:
-        """Check if cached data has expired."""
-        return time.time() - self.timestamp > ttl
+    def is_expired(self, ttl: float, now: float | None = None) -> bool:
+        """
+        Check if cached data has expired.
+
+        Args:
+            ttl: Time-to-live in seconds
+            now: Current time, so callers checking many entries read the clock once
+        """
+        if now is None:
+            now = time.time()
+        return now - self.timestamp > ttl
 
     @property
     def age(self) -> float:
@@ -38,7 +48,7 @@ class CachedData:
         return time.time() - self.timestamp
 
 
-@dataclass
+@dataclass(slots=True)
 class DataSourceStatus:
     """Status information for a data source."""
 
@@ -61,6 +71,9 @@ class DataCache:
     All sensor and service data is cached for 60 seconds and refreshed
     every 30 seconds in the background to ensure fresh data is always
     available without blocking API requests.
+
+    The cache is only touched from the event loop thread, and no method awaits
+    between reading and writing its dicts, so each call is atomic without a lock.
     """
 
     def __init__(self, cache_ttl: float = 60.0, poll_interval: float = 30.0):
@@ -74,11 +87,14 @@ class DataCache:
         self.cache_ttl = cache_ttl
         self.poll_interval = poll_interval
         self._cache: dict[str, CachedData] = {}
-        self._lock = asyncio.Lock()
         self._polling_task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
         self._data_sources: dict[str, DataSource] = {}
         self._source_status: dict[str, DataSourceStatus] = {}
+        # Metadata captured at registration so polling doesn't rebuild it every cycle
+        self._source_metadata: dict[str, DataSourceMetadata] = {}
+        # Set (and replaced) after every poll cycle so readers can await fresh data
+        self._update_event = asyncio.Event()
 
         logger.info("DataCache initialized", cache_ttl=cache_ttl, poll_interval=poll_interval)
 
@@ -91,6 +107,7 @@ class DataCache:
         """
         metadata = source.get_metadata()
         self._data_sources[metadata.source_id] = source
+        self._source_metadata[metadata.source_id] = metadata
         logger.info(
             "Registered data source",
             source_name=metadata.name,
@@ -108,18 +125,47 @@ class DataCache:
         Returns:
             Cached data or default value
         """
-        async with self._lock:
-            cached = self._cache.get(key)
-            if cached is None:
-                logger.debug("Cache miss", key=key)
-                return default
+        cached = self._cache.get(key)
+        if cached is None:
+            logger.debug("Cache miss", key=key)
+            return default
+
+        age = time.time() - cached.timestamp
+        if age > self.cache_ttl:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cache expired", key=key, age=round(age, 1))
+            return default
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cache hit", key=key, age=round(age, 1))
+        return cached.data
+
+    async def get_many(
+        self, keys: Iterable[str], default: Any = None, *, with_source_status: bool = False
+    ) -> dict[str, Any]:
+        """
+        Get cached data for several keys in one consistent read.
 
-            if cached.is_expired(self.cache_ttl):
-                logger.debug("Cache expired", key=key, age=round(cached.age, 1))
-                return default
+        Args:
+            keys: Cache keys to look up
+            default: Default value for keys that are missing or expired
+            with_source_status: Also include "datasource_status" (as returned by
+                get_all_source_status), read in the same step so it matches the data
 
-            logger.debug("Cache hit", key=key, age=round(cached.age, 1))
-            return cached.data
+        Returns:
+            Dictionary mapping each key to its cached data or the default
+        """
+        now = time.time()
+        result = {}
+        for key in keys:
+            cached = self._cache.get(key)
+            if cached is None or cached.is_expired(self.cache_ttl, now):
+                result[key] = default
+            else:
+                result[key] = cached.data
+        if with_source_status:
+            result["datasource_status"] = self._source_status_list(now)
+        return result
 
     async def set(self, key: str, data: Any) -> None:
         """
@@ -129,9 +175,8 @@ class DataCache:
             key: Cache key
             data: Data to cache
         """
-        async with self._lock:
-            self._cache[key] = CachedData(data)
-            logger.debug("Cache updated", key=key)
+        self._cache[key] = CachedData(data)
+        logger.debug("Cache updated", key=key)
 
     async def get_all(self) -> dict[str, Any]:
         """
@@ -140,12 +185,12 @@ class DataCache:
         Returns:
             Dictionary of all cached data
         """
-        async with self._lock:
-            return {
-                key: cached.data
-                for key, cached in self._cache.items()
-                if not cached.is_expired(self.cache_ttl)
-            }
+        now = time.time()
+        return {
+            key: cached.data
+            for key, cached in self._cache.items()
+            if not cached.is_expired(self.cache_ttl, now)
+        }
 
     async def get_status(self) -> dict[str, Any]:
         """
@@ -154,56 +199,67 @@ class DataCache:
         Returns:
             Dictionary with cache statistics
         """
-        async with self._lock:
-            total = len(self._cache)
-            expired = sum(1 for c in self._cache.values() if c.is_expired(self.cache_ttl))
-            ages = {k: c.age for k, c in self._cache.items()}
-
-            return {
-                "total_entries": total,
-                "valid_entries": total - expired,
-                "expired_entries": expired,
-                "cache_ttl": self.cache_ttl,
-                "poll_interval": self.poll_interval,
-                "polling_active": self._polling_task is not None and not self._polling_task.done(),
-                "data_ages": ages,
-            }
+        now = time.time()
+        total = len(self._cache)
+        ages = {k: now - c.timestamp for k, c in self._cache.items()}
+        expired = sum(1 for age in ages.values() if age > self.cache_ttl)
 
-    async def _poll_data_source(self, source: "DataSource") -> None:
+        return {
+            "total_entries": total,
+            "valid_entries": total - expired,
+            "expired_entries": expired,
+            "cache_ttl": self.cache_ttl,
+            "poll_interval": self.poll_interval,
+            "polling_active": self._polling_task is not None and not self._polling_task.done(),
+            "data_ages": ages,
+        }
+
+    async def _poll_data_source(
+        self, source: "DataSource", metadata: Optional["DataSourceMetadata"] = None
+    ) -> None:
         """
         Poll a data source and update cache.
 
         Args:
             source: DataSource object to poll
+            metadata: Metadata captured at registration (fetched from the source if omitted)
         """
-        metadata = source.get_metadata()
+        if metadata is None:
+            metadata = source.get_metadata()
         key = metadata.source_id
+        # Checked once per poll so disabled debug logging costs nothing below
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         try:
-            logger.debug("Polling data source", source_name=metadata.name, source_id=key)
+            if debug_enabled:
+                logger.debug("Polling data source", source_name=metadata.name, source_id=key)
             readings = await source.fetch_readings()
 
             # Convert readings to dict format with values and timestamps
-            data = {}
-            for reading in readings:
-                data[reading.sensor_id] = {
+            data = {
+                reading.sensor_id: {
                     "value": reading.value,
                     "timestamp": reading.timestamp.timestamp(),
                 }
+                for reading in readings
+            }
 
-            await self.set(key, data)
+            # Store data and status with no await in between so readers never see
+            # one without the other
+            self._cache[key] = CachedData(data)
             self._source_status[key] = DataSourceStatus(
                 source_id=key,
                 name=metadata.name,
                 success=True,
                 error=None,
             )
-            logger.debug(
-                "Poll completed",
-                source_name=metadata.name,
-                source_id=key,
-                readings_count=len(readings),
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Poll completed",
+                    source_name=metadata.name,
+                    source_id=key,
+                    readings_count=len(readings),
+                )
         except Exception as e:
             self._source_status[key] = DataSourceStatus(
                 source_id=key,
@@ -219,32 +275,69 @@ class DataCache:
                 exc_info=True,
             )
 
+    async def _poll_all_sources(self) -> None:
+        """Poll every registered data source once, concurrently."""
+        # Sources are independent and mostly wait on network, BLE or subprocess I/O,
+        # so a cycle takes as long as the slowest source rather than the sum of all.
+        # _poll_data_source records failures itself, so gather never raises here.
+        if not self._stop_event.is_set():
+            await asyncio.gather(
+                *(
+                    self._poll_data_source(source, self._source_metadata.get(source_id))
+                    for source_id, source in self._data_sources.items()
+                )
+            )
+
+        # Wake everyone waiting on this cycle, then arm a fresh event for the next one
+        self._update_event.set()
+        self._update_event = asyncio.Event()
+
+    async def wait_for_update(self, timeout: float | None = None) -> bool:
+        """
+        Wait until the next poll cycle has refreshed the cache.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a poll cycle completed, False if the timeout elapsed first
+        """
+        event = self._update_event
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def _polling_loop(self) -> None:
-        """Background polling loop that fetches fresh data periodically."""
+        """
+        Background polling loop that fetches fresh data periodically.
+
+        The first cycle waits a full poll interval, since start_polling()
+        already populated the cache with an immediate poll.
+        """
         logger.info("Background polling loop started")
 
+        wait_time = self.poll_interval
         while not self._stop_event.is_set():
-            cycle_start = time.time()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), timeout=wait_time)
+            if self._stop_event.is_set():
+                break
 
-            # Poll all data sources
-            data_sources = list(self._data_sources.values())
-            for source in data_sources:
-                if self._stop_event.is_set():
-                    break
-                await self._poll_data_source(source)
+            cycle_start = time.monotonic()
+            await self._poll_all_sources()
 
             # Wait for next poll interval
-            elapsed = time.time() - cycle_start
+            elapsed = time.monotonic() - cycle_start
             wait_time = max(0, self.poll_interval - elapsed)
 
-            if wait_time > 0:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Polling cycle completed",
                     elapsed=round(elapsed, 2),
                     wait_time=round(wait_time, 2),
                 )
-                with contextlib.suppress(asyncio.TimeoutError):
-                    await asyncio.wait_for(self._stop_event.wait(), timeout=wait_time)
 
         logger.info("Background polling loop stopped")
 
@@ -258,10 +351,9 @@ class DataCache:
         self._polling_task = asyncio.create_task(self._polling_loop())
         logger.info("Background polling task started")
 
-        # Do an immediate poll to populate cache
-        data_sources = list(self._data_sources.values())
-        for source in data_sources:
-            await self._poll_data_source(source)
+        # Do an immediate poll to populate cache. The loop sleeps through its
+        # first interval, so each source is fetched and written once at startup.
+        await self._poll_all_sources()
 
     async def stop_polling(self) -> None:
         """Stop the background polling task."""
@@ -283,10 +375,9 @@ class DataCache:
 
     async def clear(self) -> None:
         """Clear all cached data."""
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            logger.info("Cache cleared", entries_cleared=count)
+        count = len(self._cache)
+        self._cache.clear()
+        logger.info("Cache cleared", entries_cleared=count)
 
     # =========================================================================
     # PUBLIC API FOR DATA SOURCE ACCESS
@@ -342,7 +433,8 @@ class DataCache:
             Dict mapping source_id to DataSourceMetadata
         """
         return {
-            source_id: source.get_metadata() for source_id, source in self._data_sources.items()
+            source_id: self._source_metadata.get(source_id) or source.get_metadata()
+            for source_id, source in self._data_sources.items()
         }
 
     def is_source_registered(self, source_id: str) -> bool:
@@ -364,6 +456,10 @@ class DataCache:
         Returns:
             List of status dicts with source_id, name, success, error, and last_update
         """
+        return self._source_status_list(time.time())
+
+    def _source_status_list(self, now: float) -> list[dict[str, Any]]:
+        """Build the per-source status dicts relative to a single clock reading."""
         return [
             {
                 "source_id": status.source_id,
@@ -371,7 +467,7 @@ class DataCache:
                 "success": status.success,
                 "error": status.error,
                 "last_update": status.last_update,
-                "age": status.age,
+                "age": now - status.last_update,
             }
             for status in self._source_status.values()
         ]
@@ -9,6 +9,13 @@ import sys
 
 from sense_pulse import __version__
 
+try:
+    # Installed with uvicorn[standard]; the server runs inside our own event loop,
+    # so uvicorn never gets the chance to select uvloop for us
+    import uvloop
+except ImportError:  # pragma: no cover - exercised only without uvloop
+    uvloop = None  # type: ignore[assignment]
+
 
 def setup_logging(level: str, log_file: str | None) -> None:
     """Configure logging handlers including WebSocket handler for log streaming"""
@@ -217,13 +224,16 @@ async def async_main() -> int:
     # Setup signal handlers for graceful shutdown
     shutdown_event = asyncio.Event()
     main_task: asyncio.Task | None = None
+    web_server_task: asyncio.Task | None = None
 
     def signal_handler(sig: signal.Signals) -> None:
         logger.info("Received shutdown signal", signal=sig.name)
         shutdown_event.set()
-        # Also cancel the main task to interrupt any blocking operations
-        if main_task and not main_task.done():
-            main_task.cancel()
+        # Also cancel running tasks right away so they unwind concurrently,
+        # rather than the web server waiting for the display loop to finish
+        for task in (main_task, web_server_task):
+            if task and not task.done():
+                task.cancel()
 
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
@@ -259,7 +269,6 @@ async def async_main() -> int:
         # =====================================================================
         # Start web server in background (unless disabled)
         # =====================================================================
-        web_server_task = None
         if not args.no_web:
             import uvicorn
 
@@ -330,6 +339,8 @@ async def async_main() -> int:
 
 def main() -> int:
     """Main entry point - wraps async_main()"""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     return asyncio.run(async_main())
 
 
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 import yaml
 
@@ -16,6 +17,12 @@ CONFIG_PATHS = [
     Path("/etc/sense-pulse/config.yaml"),
 ]
 
+# The config file is trusted local input, so use libyaml's C safe loader when
+# PyYAML was built with it (same safe-load semantics, much faster parsing)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Likewise for writing config updates back to disk
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @dataclass
 class PiholeConfig:
@@ -173,37 +180,54 @@ def load_config(config_path: str | None = None) -> Config:
 
     logger.info("Loading config", path=str(path))
 
+    return parse_config(read_config_data(path))
+
+
+def read_config_data(path: Path) -> dict[str, Any]:
+    """
+    Read the raw configuration mapping from a YAML file.
+
+    Args:
+        path: Path to the YAML config file
+
+    Returns:
+        Parsed mapping (empty dict for an empty file)
+    """
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        data: dict[str, Any] = yaml.load(f, Loader=YAML_LOADER) or {}
+    return data
 
+
+def parse_config(data: dict[str, Any]) -> Config:
+    """
+    Build a Config from already-loaded configuration data.
+
+    Args:
+        data: Parsed YAML mapping (top-level sections as keys)
+
+    Returns:
+        Config instance with defaults for any missing sections
+    """
     # Parse Aranet4 config with sensor list (migrate old office/bedroom format)
     aranet4_data = data.get("aranet4", {})
-    sensors = []
 
     # New format: sensors list
-    if "sensors" in aranet4_data:
-        for sensor_data in aranet4_data["sensors"]:
-            sensors.append(Aranet4SensorConfig(**sensor_data))
+    sensors_data = aranet4_data.get("sensors")
+    if sensors_data is not None:
+        sensors = [Aranet4SensorConfig(**sensor_data) for sensor_data in sensors_data]
     # Old format migration: office/bedroom
     else:
-        if "office" in aranet4_data and aranet4_data["office"].get("mac_address"):
-            office = aranet4_data["office"]
-            sensors.append(
-                Aranet4SensorConfig(
-                    label=office.get("label", "Office"),
-                    mac_address=office.get("mac_address", ""),
-                    enabled=office.get("enabled", False),
-                )
-            )
-        if "bedroom" in aranet4_data and aranet4_data["bedroom"].get("mac_address"):
-            bedroom = aranet4_data["bedroom"]
-            sensors.append(
-                Aranet4SensorConfig(
-                    label=bedroom.get("label", "Bedroom"),
-                    mac_address=bedroom.get("mac_address", ""),
-                    enabled=bedroom.get("enabled", False),
+        sensors = []
+        for key, default_label in (("office", "Office"), ("bedroom", "Bedroom")):
+            legacy = aranet4_data.get(key)
+            if legacy and legacy.get("mac_address"):
+                sensors.append(
+                    Aranet4SensorConfig(
+                        label=legacy.get("label", default_label),
+                        mac_address=legacy["mac_address"],
+                        enabled=legacy.get("enabled", False),
+                    )
                 )
-            )
 
     aranet4_config = Aranet4Config(
         sensors=sensors,
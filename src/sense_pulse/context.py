@@ -19,6 +19,7 @@ Usage:
     await context.shutdown()
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
@@ -33,7 +34,7 @@ if TYPE_CHECKING:
     from sense_pulse.devices.network_camera import NetworkCameraDevice
 
 from sense_pulse.cache import DataCache
-from sense_pulse.config import Config, load_config
+from sense_pulse.config import YAML_DUMPER, Config, load_config, parse_config, read_config_data
 from sense_pulse.web.log_handler import get_structured_logger
 
 logger = get_structured_logger(__name__, component="context")
@@ -67,6 +68,12 @@ class AppContext:
     aranet4_device: Optional["Aranet4Device"] = None
     network_camera_device: Optional["NetworkCameraDevice"] = None
     _started: bool = field(default=False, repr=False)
+    _sources_by_id: dict[str, "DataSource"] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index data sources passed to the constructor by source_id."""
+        for source in self.data_sources:
+            self._sources_by_id.setdefault(source.get_metadata().source_id, source)
 
     @classmethod
     def create(
@@ -116,6 +123,7 @@ class AppContext:
         """
         self.data_sources.append(source)
         metadata = source.get_metadata()
+        self._sources_by_id.setdefault(metadata.source_id, source)
         logger.debug(
             "Added data source",
             source_name=metadata.name,
@@ -146,12 +154,23 @@ class AppContext:
         total_sources = len(self.data_sources)
         logger.info("Starting AppContext", total_sources=total_sources)
 
-        # Initialize all data sources
+        # Initialize all data sources concurrently (Pi-hole auth, HTTP clients and
+        # Sense HAT setup are independent), then register them in their added order
+        results = await asyncio.gather(
+            *(source.initialize() for source in self.data_sources), return_exceptions=True
+        )
         initialized_count = 0
-        for source in self.data_sources:
+        for source, result in zip(self.data_sources, results, strict=True):
             metadata = source.get_metadata()
-            try:
-                await source.initialize()
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Data source initialization failed",
+                    source_name=metadata.name,
+                    source_id=metadata.source_id,
+                    error=str(result),
+                    status="error",
+                )
+            else:
                 self.cache.register_data_source(source)
                 initialized_count += 1
                 logger.info(
@@ -160,14 +179,6 @@ class AppContext:
                     source_id=metadata.source_id,
                     status="ok",
                 )
-            except Exception as e:
-                logger.error(
-                    "Data source initialization failed",
-                    source_name=metadata.name,
-                    source_id=metadata.source_id,
-                    error=str(e),
-                    status="error",
-                )
 
         # Start background polling
         await self.cache.start_polling()
@@ -198,24 +209,26 @@ class AppContext:
         # Stop polling first
         await self.cache.stop_polling()
 
-        # Shutdown all data sources
+        # Shutdown all data sources concurrently; each closes its own clients
+        results = await asyncio.gather(
+            *(source.shutdown() for source in self.data_sources), return_exceptions=True
+        )
         shutdown_count = 0
-        for source in self.data_sources:
+        for source, result in zip(self.data_sources, results, strict=True):
             metadata = source.get_metadata()
-            try:
-                await source.shutdown()
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Data source shutdown failed",
+                    source_name=metadata.name,
+                    error=str(result),
+                )
+            else:
                 shutdown_count += 1
                 logger.debug(
                     "Data source shutdown",
                     source_name=metadata.name,
                     status="ok",
                 )
-            except Exception as e:
-                logger.error(
-                    "Data source shutdown failed",
-                    source_name=metadata.name,
-                    error=str(e),
-                )
 
         self._started = False
         logger.info("AppContext shutdown complete", sources_shutdown=shutdown_count)
@@ -235,10 +248,7 @@ class AppContext:
         Returns:
             The DataSource if found, None otherwise
         """
-        for source in self.data_sources:
-            if source.get_metadata().source_id == source_id:
-                return source
-        return None
+        return self._sources_by_id.get(source_id)
 
     def reload_config(self) -> Config:
         """
@@ -274,24 +284,23 @@ class AppContext:
             raise RuntimeError("Cannot update config: config_path not set or file doesn't exist")
 
         # Load current config file
-        with open(self.config_path) as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = read_config_data(self.config_path)
 
-        # Deep merge updates into config_data
+        # Merge updates into config_data in place, one lookup per section
         for section, section_updates in updates.items():
-            if section not in config_data:
-                config_data[section] = {}
             if isinstance(section_updates, dict):
-                config_data[section].update(section_updates)
+                config_data.setdefault(section, {}).update(section_updates)
             else:
                 config_data[section] = section_updates
 
         # Write back to file
         with open(self.config_path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_data, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
-        # Reload config from file
-        return self.reload_config()
+        # Build config from the merged data we just wrote instead of re-reading the file
+        self.config = parse_config(config_data)
+        logger.info("Updated config", path=str(self.config_path), sections=list(updates))
+        return self.config
 
     def __repr__(self) -> str:
         sources = [s.get_metadata().source_id for s in self.data_sources]
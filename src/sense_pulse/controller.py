@@ -2,6 +2,7 @@
 
 import asyncio
 import contextlib
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,6 +16,22 @@ from sense_pulse.web.log_handler import get_structured_logger
 
 logger = get_structured_logger(__name__, component="display")
 
+# Weather condition patterns mapped to icon names, checked in priority order.
+# Each group of keywords is compiled once into a case-insensitive alternation
+# so matching a condition string is a single regex search per icon.
+WEATHER_ICON_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+    (re.compile("|".join(keywords), re.IGNORECASE), icon)
+    for keywords, icon in (
+        (("clear", "sunny"), "sunny"),
+        (("partly",), "partly_cloudy"),
+        (("overcast", "cloud"), "cloudy"),
+        (("thunder", "lightning"), "thunderstorm"),
+        (("rain", "drizzle", "shower"), "rainy"),
+        (("snow", "sleet", "blizzard"), "snowy"),
+        (("mist", "fog", "haze"), "mist"),
+    )
+)
+
 
 class StatsDisplay:
     """Main controller for displaying stats on Sense HAT"""
@@ -341,26 +358,12 @@ class StatsDisplay:
         Returns:
             Icon name for the weather condition
         """
-        conditions_lower = conditions.lower()
-
-        # Map common weather conditions to icons
-        if any(word in conditions_lower for word in ["clear", "sunny"]):
-            return "sunny"
-        elif any(word in conditions_lower for word in ["partly cloudy", "partly"]):
-            return "partly_cloudy"
-        elif any(word in conditions_lower for word in ["overcast", "cloudy", "cloud"]):
-            return "cloudy"
-        elif any(word in conditions_lower for word in ["thunder", "thunderstorm", "lightning"]):
-            return "thunderstorm"
-        elif any(word in conditions_lower for word in ["rain", "drizzle", "shower"]):
-            return "rainy"
-        elif any(word in conditions_lower for word in ["snow", "sleet", "blizzard"]):
-            return "snowy"
-        elif any(word in conditions_lower for word in ["mist", "fog", "haze"]):
-            return "mist"
-        else:
-            # Default to cloudy for unknown conditions
-            return "cloudy"
+        for pattern, icon in WEATHER_ICON_PATTERNS:
+            if pattern.search(conditions):
+                return icon
+
+        # Default to cloudy for unknown conditions
+        return "cloudy"
 
     async def display_weather(self):
         """Display current weather conditions (from cache)"""
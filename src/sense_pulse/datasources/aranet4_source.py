@@ -29,7 +29,9 @@ class Aranet4DataSource(DataSource):
     def __init__(self, config: Aranet4Config, device: Aranet4Device):
         self._config = config
         self._device = device
-        self._enabled = len([s for s in config.sensors if s.enabled]) > 0
+        self._enabled = any(sensor.enabled for sensor in config.sensors)
+        # Built on first use; cleared whenever the registered sensors or enabled flag change
+        self._metadata: DataSourceMetadata | None = None
 
     async def initialize(self) -> None:
         """Initialize sensor instances and register with device."""
@@ -64,51 +66,55 @@ class Aranet4DataSource(DataSource):
         except Exception as e:
             logger.error("Error initializing Aranet4", error=str(e))
             self._enabled = False
+        finally:
+            self._metadata = None
 
     async def fetch_readings(self) -> list[SensorReading]:
         """Fetch readings via BLE scan."""
         if not self._enabled or not self._device.sensors:
             return []
 
-        readings = []
         logger.info("Fetching Aranet4 readings", sensor_count=len(self._device.sensors))
 
         # Device handles lock coordination and BLE scanning
         results = await self._device.read_all_sensors()
 
-        for label, reading_data in results.items():
-            if reading_data:
-                readings.append(
-                    SensorReading(
-                        sensor_id=label,
-                        value={
-                            "temperature": reading_data.temperature,
-                            "co2": reading_data.co2,
-                            "humidity": reading_data.humidity,
-                            "pressure": reading_data.pressure,
-                            "battery": reading_data.battery,
-                        },
-                        unit=None,
-                        timestamp=datetime.fromtimestamp(reading_data.timestamp),
-                    )
-                )
+        # One reading per sensor, built in a single pass over the scan results
+        readings = [
+            SensorReading(
+                sensor_id=label,
+                value={
+                    "temperature": reading_data.temperature,
+                    "co2": reading_data.co2,
+                    "humidity": reading_data.humidity,
+                    "pressure": reading_data.pressure,
+                    "battery": reading_data.battery,
+                },
+                unit=None,
+                timestamp=datetime.fromtimestamp(reading_data.timestamp),
+            )
+            for label, reading_data in results.items()
+            if reading_data
+        ]
 
         logger.info("Aranet4 fetch completed", readings_count=len(readings))
         return readings
 
     def get_metadata(self) -> DataSourceMetadata:
         """Get Aranet4 data source metadata"""
-        sensor_count = len(self._device.sensors)
-        sensor_list = ", ".join(self._device.sensors.keys()) if self._device.sensors else "none"
-
-        return DataSourceMetadata(
-            source_id="co2",
-            name="Aranet4 CO2 Sensors",
-            description=f"BLE CO2 sensors: {sensor_list} ({sensor_count} configured)",
-            refresh_interval=30,
-            requires_auth=False,
-            enabled=self._enabled,
-        )
+        if self._metadata is None:
+            sensor_count = len(self._device.sensors)
+            sensor_list = ", ".join(self._device.sensors.keys()) if self._device.sensors else "none"
+
+            self._metadata = DataSourceMetadata(
+                source_id="co2",
+                name="Aranet4 CO2 Sensors",
+                description=f"BLE CO2 sensors: {sensor_list} ({sensor_count} configured)",
+                refresh_interval=30,
+                requires_auth=False,
+                enabled=self._enabled,
+            )
+        return self._metadata
 
     async def health_check(self) -> bool:
         """Check if Aranet4 source is configured with sensors."""
@@ -11,11 +11,14 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorReading:
     """
     A single sensor reading with metadata.
 
+    Readings are created for every sensor on every poll, so the class uses
+    __slots__ to keep instances small and attribute access fast.
+
     Attributes:
         sensor_id: Unique identifier for this sensor (e.g., "co2", "pihole_queries")
         value: The actual sensor value
@@ -31,11 +34,14 @@ class SensorReading:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataSourceMetadata:
     """
     Metadata describing a data source.
 
+    Metadata is cached by the data cache and shared between callers, so it is
+    immutable; sources build a new instance when their configuration changes.
+
     Attributes:
         source_id: Unique identifier for this data source
         name: Human-readable name
@@ -1,5 +1,6 @@
 """Pi-hole data source implementation"""
 
+import logging
 from datetime import datetime
 
 from ..config import PiholeConfig
@@ -57,12 +58,13 @@ class PiHoleDataSource(DataSource):
             summary = await self._stats.get_summary()
             now = datetime.now()
 
-            logger.debug(
-                "Pi-hole readings fetched",
-                queries=summary["queries_today"],
-                blocked=summary["ads_blocked_today"],
-                block_percent=round(summary["ads_percentage_today"], 1),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Pi-hole readings fetched",
+                    queries=summary["queries_today"],
+                    blocked=summary["ads_blocked_today"],
+                    block_percent=round(summary["ads_percentage_today"], 1),
+                )
 
             return [
                 SensorReading(
@@ -21,19 +21,25 @@ class DataSourceRegistry:
         """
         Register a data source.
 
+        Registering the same instance again is a no-op.
+
         Args:
             source: The data source to register
 
         Raises:
-            ValueError: If a source with the same ID is already registered
+            ValueError: If a different source with the same ID is already registered
         """
         metadata = source.get_metadata()
         source_id = metadata.source_id
 
-        if source_id in self._sources:
+        existing = self._sources.get(source_id)
+        if existing is source:
+            return
+        if existing is not None:
+            # The first registration wins
             raise ValueError(f"Data source '{source_id}' is already registered")
-
         self._sources[source_id] = source
+
         logger.info("Registered data source", name=metadata.name, source_id=source_id)
 
     def unregister(self, source_id: str) -> None:
@@ -43,8 +49,7 @@ class DataSourceRegistry:
         Args:
             source_id: ID of the source to unregister
         """
-        if source_id in self._sources:
-            del self._sources[source_id]
+        if self._sources.pop(source_id, None) is not None:
             logger.info("Unregistered data source", source_id=source_id)
         else:
             logger.warning("Attempted to unregister unknown source", source_id=source_id)
@@ -1,5 +1,6 @@
 """System statistics data source implementation"""
 
+import logging
 from datetime import datetime
 
 from ..devices.system import SystemStats
@@ -35,13 +36,14 @@ class SystemStatsDataSource(DataSource):
             stats = await self._stats.get_stats()
             now = datetime.now()
 
-            logger.debug(
-                "System stats fetched",
-                cpu_percent=stats["cpu_percent"],
-                memory_percent=stats["memory_percent"],
-                load_1min=round(stats["load_1min"], 2),
-                cpu_temp=stats["cpu_temp"],
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "System stats fetched",
+                    cpu_percent=stats["cpu_percent"],
+                    memory_percent=stats["memory_percent"],
+                    load_1min=round(stats["load_1min"], 2),
+                    cpu_temp=stats["cpu_temp"],
+                )
 
             return [
                 SensorReading(
@@ -5,6 +5,7 @@ from datetime import datetime
 import httpx
 
 from ..config import WeatherConfig
+from ..utils.serialization import loads
 from ..web.log_handler import get_structured_logger
 from .base import DataSource, DataSourceMetadata, SensorReading
 
@@ -33,7 +34,11 @@ class WeatherDataSource(DataSource):
 
     async def initialize(self) -> None:
         """Initialize HTTP client for weather API"""
-        self._client = httpx.AsyncClient(timeout=10.0)
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            # One request per refresh; no need for httpx's default 100-connection pool
+            limits=httpx.Limits(max_connections=2, max_keepalive_connections=1),
+        )
         logger.info(
             "Weather data source initialized",
             location=self._config.location or "auto",
@@ -72,7 +77,8 @@ class WeatherDataSource(DataSource):
 
             response = await self._client.get(url)
             response.raise_for_status()
-            data = response.json()
+            # Parse the raw body directly; the j1 payload includes a multi-day forecast
+            data = loads(response.content)
 
             # Cache the data
             self._last_data = data
@@ -282,7 +288,7 @@ class WeatherDataSource(DataSource):
             response = await self._client.get(url, timeout=5.0)
             return response.status_code == 200
         except Exception as e:
-            logger.debug(f"Weather health check failed: {e}")
+            logger.debug("Weather health check failed", error=str(e))
             return False
 
     async def shutdown(self) -> None:
@@ -6,12 +6,20 @@ See: https://github.com/hbldh/bleak/issues/1475
 """
 
 import asyncio
+import contextlib
+import logging
 import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
 from ..web.log_handler import get_structured_logger
 
+try:
+    # Imported once here rather than inside every scan call
+    import aranet4
+except ImportError:  # pragma: no cover - exercised only without aranet4
+    aranet4 = None
+
 logger = get_structured_logger(__name__, component="aranet4")
 
 
@@ -25,6 +33,8 @@ class Aranet4Device:
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
         self._sensors: dict[str, Aranet4Sensor] = {}
+        # In-flight discovery scans keyed by duration, shared by concurrent callers
+        self._scan_tasks: dict[int, asyncio.Task] = {}
 
     def add_sensor(self, label: str, sensor: "Aranet4Sensor") -> None:
         """Register a sensor with this device manager."""
@@ -39,11 +49,16 @@ class Aranet4Device:
         """Get all registered sensors."""
         return self._sensors
 
-    async def read_all_sensors(self) -> dict[str, Optional["Aranet4Reading"]]:
-        """Read all sensors via single BLE scan (10 seconds).
+    async def read_all_sensors(self, duration: float = 10) -> dict[str, Optional["Aranet4Reading"]]:
+        """Read all sensors via single BLE scan (up to 10 seconds).
 
         Uses passive BLE scanning to collect readings from advertisements.
-        This is more reliable than direct connections.
+        This is more reliable than direct connections. The scan stops as soon
+        as every registered sensor has reported, so it only runs the full
+        duration when a sensor is out of range.
+
+        Args:
+            duration: Maximum duration of scan in seconds
 
         Returns:
             Dict mapping sensor labels to readings (None if sensor not found in scan)
@@ -53,55 +68,73 @@ class Aranet4Device:
 
         # Build MAC -> label lookup
         mac_to_label = {sensor.mac_address: label for label, sensor in self._sensors.items()}
-        results: dict[str, Aranet4Reading | None] = {label: None for label in self._sensors}
-        found: set[str] = set()  # Track found MACs to avoid duplicate processing
+        results: dict[str, Aranet4Reading | None] = dict.fromkeys(self._sensors)
+        remaining = len(mac_to_label)  # Sensors that haven't reported yet
+        all_found = asyncio.Event()
 
-        try:
-            import aranet4
+        if aranet4 is None:
+            logger.error("aranet4 package not installed")
+            return results
 
+        try:
             logger.info("Starting Aranet4 scan for readings", sensor_count=len(self._sensors))
 
             def on_detect(advertisement: Any) -> None:
-                addr = advertisement.device.address.upper()
-                # Only process first advertisement per sensor
-                if addr in mac_to_label and advertisement.readings and addr not in found:
-                    found.add(addr)
-                    label = mac_to_label[addr]
-                    r = advertisement.readings
-                    reading = Aranet4Reading(
-                        co2=r.co2,
-                        temperature=round(r.temperature, 1),
-                        humidity=int(r.humidity),
-                        pressure=round(r.pressure, 1),
-                        battery=r.battery,
-                        interval=r.interval,
-                        ago=r.ago,
-                        timestamp=time.time(),
-                    )
-                    results[label] = reading
-                    logger.info(
-                        "Aranet4 reading from scan",
-                        sensor=label,
-                        co2=reading.co2,
-                        temperature=reading.temperature,
-                    )
+                nonlocal remaining
+                # Configured MACs are stored uppercased, so one lookup per advertisement
+                label = mac_to_label.get(advertisement.device.address.upper())
+                # Only process first advertisement per sensor; a stored reading marks it done
+                if label is None or results[label] is not None or not advertisement.readings:
+                    return
+
+                r = advertisement.readings
+                reading = Aranet4Reading(
+                    co2=r.co2,
+                    temperature=round(r.temperature, 1),
+                    humidity=int(r.humidity),
+                    pressure=round(r.pressure, 1),
+                    battery=r.battery,
+                    interval=r.interval,
+                    ago=r.ago,
+                    timestamp=scan_ts,
+                )
+                results[label] = reading
+                logger.info(
+                    "Aranet4 reading from scan",
+                    sensor=label,
+                    co2=reading.co2,
+                    temperature=reading.temperature,
+                )
+                remaining -= 1
+                if not remaining:
+                    all_found.set()
 
             async with self._lock:
-                await aranet4.client._find_nearby(on_detect, duration=10)
-
-            found_labels = [label for label, reading in results.items() if reading]
-            missing_labels = [label for label, reading in results.items() if not reading]
-            logger.info(
-                "Aranet4 scan complete",
-                found=found_labels,
-                missing=missing_labels,
-            )
+                # Every reading in this poll shares one timestamp, taken once the
+                # scan actually starts rather than per advertisement
+                scan_ts = time.time()
+                # Drive the scanner directly rather than via _find_nearby, which
+                # always sleeps out the full duration
+                scanner = aranet4.client.Aranet4Scanner(on_detect)
+                await scanner.start()
+                try:
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(all_found.wait(), timeout=duration)
+                finally:
+                    await scanner.stop()
+
+            # Only build the found/missing lists if the summary will be emitted
+            if logger.isEnabledFor(logging.INFO):
+                found_labels = [label for label, reading in results.items() if reading]
+                missing_labels = [label for label, reading in results.items() if not reading]
+                logger.info(
+                    "Aranet4 scan complete",
+                    found=found_labels,
+                    missing=missing_labels,
+                )
 
             return results
 
-        except ImportError:
-            logger.error("aranet4 package not installed")
-            return results
         except Exception as e:
             logger.error("BLE scan error", error=str(e))
             return results
@@ -109,32 +142,58 @@ class Aranet4Device:
     async def scan_for_devices(self, duration: int = 10) -> list[dict[str, Any]]:
         """Scan for Aranet4 devices in range.
 
+        Concurrent calls with the same duration share one in-flight scan rather
+        than queueing a full BLE scan each behind the lock.
+
         Args:
             duration: Duration of scan in seconds
 
         Returns:
             List of discovered devices with their info
         """
-        try:
-            import aranet4
+        task = self._scan_tasks.get(duration)
+        if task is None:
+            task = asyncio.create_task(self._scan_for_devices(duration))
+            self._scan_tasks[duration] = task
+            task.add_done_callback(lambda _: self._scan_tasks.pop(duration, None))
+        # Shielded so one caller going away doesn't cancel the scan for the others
+        devices: list[dict[str, Any]] = await asyncio.shield(task)
+        return list(devices)
+
+    async def _scan_for_devices(self, duration: int) -> list[dict[str, Any]]:
+        """Run one BLE discovery scan.
+
+        Args:
+            duration: Duration of scan in seconds
 
+        Returns:
+            List of discovered devices with their info
+        """
+        if aranet4 is None:
+            logger.error("aranet4 package not installed")
+            return []
+
+        try:
             logger.info("Starting Aranet4 discovery scan", duration=duration)
 
             found_devices: list[dict[str, Any]] = []
             seen_addresses: set[str] = set()
 
             def on_detect(advertisement: Any) -> None:
-                if advertisement.device.address not in seen_addresses:
-                    seen_addresses.add(advertisement.device.address)
+                device = advertisement.device
+                address = device.address
+                if address not in seen_addresses:
+                    seen_addresses.add(address)
                     device_info: dict[str, Any] = {
-                        "name": advertisement.device.name or "Aranet4",
-                        "address": advertisement.device.address.upper(),
+                        "name": device.name or "Aranet4",
+                        "address": address.upper(),
                         "rssi": advertisement.rssi,
                     }
-                    if advertisement.readings:
-                        device_info["co2"] = advertisement.readings.co2
-                        device_info["temperature"] = advertisement.readings.temperature
-                        device_info["humidity"] = advertisement.readings.humidity
+                    readings = advertisement.readings
+                    if readings:
+                        device_info["co2"] = readings.co2
+                        device_info["temperature"] = readings.temperature
+                        device_info["humidity"] = readings.humidity
                     found_devices.append(device_info)
                     logger.info(
                         "Aranet4 device found",
@@ -148,15 +207,12 @@ class Aranet4Device:
             logger.info("Aranet4 scan complete", devices_found=len(found_devices))
             return found_devices
 
-        except ImportError:
-            logger.error("aranet4 package not installed")
-            return []
         except Exception as e:
             logger.error("BLE scan error", error=str(e))
             return []
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Aranet4Reading:
     """Data class for Aranet4 sensor readings"""
 
@@ -13,6 +13,7 @@ Handles:
 
 import asyncio
 import contextlib
+import re
 import shutil
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -50,6 +51,21 @@ class StreamStatus(Enum):
 # Common RTSP ports to scan for cameras
 RTSP_PORTS = [554, 8554, 10554]
 
+# Patterns for stream info in FFmpeg stderr, compiled once for the reader loop
+_RESOLUTION_RE = re.compile(r"(\d{3,4})x(\d{3,4})")
+_FPS_RE = re.compile(r"(\d+(?:\.\d+)?)\s*fps")
+
+
+# Fixed parts of the thumbnail FFmpeg argv, built once instead of per capture
+_THUMBNAIL_INPUT_ARGS = ("ffmpeg", "-hide_banner", "-loglevel", "error", "-rtsp_transport")
+_THUMBNAIL_OUTPUT_ARGS = (
+    "-frames:v",
+    "1",
+    "-q:v",
+    "2",  # JPEG quality (2 = high quality)
+    "-y",  # Overwrite output
+)
+
 
 @dataclass
 class CameraInfo:
@@ -107,11 +123,18 @@ class NetworkCameraDevice:
     state: StreamState = field(default_factory=StreamState)
     _process: asyncio.subprocess.Process | None = None
     _monitor_task: asyncio.Task | None = None
+    _stderr_task: asyncio.Task | None = None
     _shutdown_event: asyncio.Event = field(default_factory=asyncio.Event)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     _thumbnail_cache: bytes | None = None
     _thumbnail_timestamp: float = 0.0
+    _thumbnail_task: asyncio.Task | None = None
+    _discovery_tasks: dict[int, asyncio.Task] = field(default_factory=dict)
     _active_camera: CameraInfo | None = None
+    # RTSP URL (and its log-safe form) for the active camera, built once per camera
+    # rather than on every status read
+    _active_rtsp_url: str = ""
+    _masked_rtsp_url: str = ""
     # PTZ control state
     _ptz_client: Any | None = None
     _ptz_service: Any | None = None
@@ -143,6 +166,7 @@ class NetworkCameraDevice:
                 ptz_step=first_camera.get("ptz_step", 0.05),
                 ptz_zoom_step=first_camera.get("ptz_zoom_step", 0.1),
             )
+            self._cache_rtsp_urls()
 
     @property
     def output_dir(self) -> Path:
@@ -174,9 +198,13 @@ class NetworkCameraDevice:
     @property
     def active_rtsp_url(self) -> str:
         """Get the active RTSP URL."""
-        if self._active_camera:
-            return self._active_camera.build_rtsp_url()
-        return ""
+        return self._active_rtsp_url
+
+    def _cache_rtsp_urls(self) -> None:
+        """Build the RTSP URL and its masked form for the active camera."""
+        url = self._active_camera.build_rtsp_url() if self._active_camera else ""
+        self._active_rtsp_url = url
+        self._masked_rtsp_url = self._mask_rtsp_url(url) if url else ""
 
     def _ensure_output_dir(self) -> None:
         """Create output directory if it doesn't exist."""
@@ -194,18 +222,16 @@ class NetworkCameraDevice:
 
     def _mask_rtsp_url(self, url: str) -> str:
         """Mask credentials in RTSP URL for logging."""
-        if "@" in url:
-            parts = url.split("@", 1)
-            protocol_and_creds = parts[0]
-            host_and_path = parts[1]
-            protocol = protocol_and_creds.split("://")[0]
-            return f"{protocol}://***@{host_and_path}"
-        return url
+        protocol_and_creds, sep, host_and_path = url.partition("@")
+        if not sep:
+            return url
+        protocol = protocol_and_creds.partition("://")[0]
+        return f"{protocol}://***@{host_and_path}"
 
     def _build_ffmpeg_command(self) -> list[str]:
         """Build the FFmpeg command for RTSP to HLS transcoding."""
         rtsp_url = self.active_rtsp_url
-        logger.info("Building FFmpeg command", rtsp_url=self._mask_rtsp_url(rtsp_url))
+        logger.info("Building FFmpeg command", rtsp_url=self._masked_rtsp_url)
 
         return [
             "ffmpeg",
@@ -249,8 +275,6 @@ class NetworkCameraDevice:
 
     async def _read_stderr(self, stderr: asyncio.StreamReader) -> None:
         """Read and log FFmpeg stderr output."""
-        import re
-
         while True:
             try:
                 line = await stderr.readline()
@@ -260,14 +284,15 @@ class NetworkCameraDevice:
                 if decoded:
                     # Parse resolution/fps from FFmpeg output if present
                     if "Video:" in decoded and "x" in decoded:
-                        match = re.search(r"(\d{3,4})x(\d{3,4})", decoded)
+                        match = _RESOLUTION_RE.search(decoded)
                         if match:
                             self.state.resolution = f"{match.group(1)}x{match.group(2)}"
-                        fps_match = re.search(r"(\d+(?:\.\d+)?)\s*fps", decoded)
+                        fps_match = _FPS_RE.search(decoded)
                         if fps_match:
                             self.state.fps = int(float(fps_match.group(1)))
                     logger.debug("FFmpeg", output=decoded)
-            except Exception:
+            except Exception as e:
+                logger.debug("FFmpeg stderr reader stopped", error=str(e))
                 break
 
     async def _monitor_stream(self) -> None:
@@ -276,7 +301,11 @@ class NetworkCameraDevice:
 
         while not self._shutdown_event.is_set():
             try:
-                await asyncio.sleep(2)
+                # Wake early on shutdown instead of finishing the sleep first
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=2)
+                if self._shutdown_event.is_set():
+                    break
 
                 if self._process is None:
                     continue
@@ -350,8 +379,9 @@ class NetworkCameraDevice:
         # Stop current process
         await self._stop_process()
 
-        # Wait before reconnecting
-        await asyncio.sleep(delay)
+        # Wait before reconnecting, giving up early if the stream is stopped
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=delay)
 
         if not self._shutdown_event.is_set():
             await self._start_process()
@@ -375,13 +405,17 @@ class NetworkCameraDevice:
             try:
                 self._process = await asyncio.create_subprocess_exec(
                     *cmd,
+                    # FFmpeg reads stdin for interactive keys; never let it inherit ours
+                    stdin=asyncio.subprocess.DEVNULL,
                     stdout=asyncio.subprocess.DEVNULL,
                     stderr=asyncio.subprocess.PIPE,
                 )
 
                 # Start stderr reader
+                # Keep a reference so the reader isn't garbage collected mid-stream
+                # and can be cancelled together with the process
                 if self._process.stderr:
-                    asyncio.create_task(self._read_stderr(self._process.stderr))
+                    self._stderr_task = asyncio.create_task(self._read_stderr(self._process.stderr))
 
                 # Wait a bit for initial stream setup
                 await asyncio.sleep(2)
@@ -430,6 +464,11 @@ class NetworkCameraDevice:
                 logger.error("Error stopping FFmpeg", error=str(e))
             finally:
                 self._process = None
+                if self._stderr_task is not None:
+                    self._stderr_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await self._stderr_task
+                    self._stderr_task = None
 
     # =========================================================================
     # Public API
@@ -517,7 +556,20 @@ class NetworkCameraDevice:
             if age < 30:
                 return self._thumbnail_cache
 
-        if not self.active_rtsp_url:
+        # Coalesce concurrent requests onto a single in-flight capture. The task is
+        # shielded so a disconnecting client doesn't cancel it for everyone else.
+        if self._thumbnail_task is None or self._thumbnail_task.done():
+            self._thumbnail_task = asyncio.create_task(self._capture_thumbnail())
+        return await asyncio.shield(self._thumbnail_task)
+
+    async def _capture_thumbnail(self) -> bytes | None:
+        """Run FFmpeg to grab one frame and update the thumbnail cache.
+
+        Returns:
+            JPEG image bytes or None if capture fails
+        """
+        rtsp_url = self.active_rtsp_url
+        if not rtsp_url:
             logger.warning("No RTSP URL for thumbnail capture")
             return None
 
@@ -527,40 +579,41 @@ class NetworkCameraDevice:
 
         self._ensure_output_dir()
 
+        thumbnail_path = self.thumbnail_path
         cmd = [
-            "ffmpeg",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-rtsp_transport",
+            *_THUMBNAIL_INPUT_ARGS,
             self.config.transport,
             "-i",
-            self.active_rtsp_url,
-            "-frames:v",
-            "1",
-            "-q:v",
-            "2",  # JPEG quality (2 = high quality)
-            "-y",  # Overwrite output
-            str(self.thumbnail_path),
+            rtsp_url,
+            *_THUMBNAIL_OUTPUT_ARGS,
+            str(thumbnail_path),
         ]
 
         try:
             logger.debug("Capturing thumbnail")
             process = await asyncio.create_subprocess_exec(
                 *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
                 stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            _, stderr = await asyncio.wait_for(process.communicate(), timeout=10.0)
+            try:
+                _, stderr = await asyncio.wait_for(process.communicate(), timeout=10.0)
+            except asyncio.TimeoutError:
+                # wait_for only cancels communicate(); kill and reap the stuck FFmpeg
+                with contextlib.suppress(ProcessLookupError):
+                    process.kill()
+                await process.wait()
+                raise
 
             if process.returncode != 0:
                 error_msg = stderr.decode("utf-8", errors="replace").strip()
                 logger.error("Thumbnail capture failed", error=error_msg)
                 return None
 
-            if self.thumbnail_path.exists():
-                self._thumbnail_cache = self.thumbnail_path.read_bytes()
+            if thumbnail_path.exists():
+                self._thumbnail_cache = thumbnail_path.read_bytes()
                 self._thumbnail_timestamp = time.time()
                 logger.debug("Thumbnail captured", size=len(self._thumbnail_cache))
                 return self._thumbnail_cache
@@ -577,6 +630,27 @@ class NetworkCameraDevice:
     async def discover_cameras(self, timeout: int = 30) -> list[CameraInfo]:
         """Discover cameras by scanning network for open RTSP ports.
 
+        Concurrent calls with the same timeout share one in-flight scan rather
+        than each sweeping the whole subnet.
+
+        Args:
+            timeout: Discovery timeout in seconds (total for all ports)
+
+        Returns:
+            List of discovered cameras with their host and port
+        """
+        task = self._discovery_tasks.get(timeout)
+        if task is None:
+            task = asyncio.create_task(self._discover_cameras(timeout))
+            self._discovery_tasks[timeout] = task
+            task.add_done_callback(lambda _: self._discovery_tasks.pop(timeout, None))
+        # Shielded so one caller going away doesn't cancel the scan for the others
+        cameras: list[CameraInfo] = await asyncio.shield(task)
+        return list(cameras)
+
+    async def _discover_cameras(self, timeout: int) -> list[CameraInfo]:
+        """Scan the local network for open RTSP ports.
+
         Args:
             timeout: Discovery timeout in seconds (total for all ports)
 
@@ -629,18 +703,17 @@ class NetworkCameraDevice:
             camera: Camera to use for streaming
         """
         self._active_camera = camera
+        self._cache_rtsp_urls()
         logger.info("Set active camera", name=camera.name)
 
     def get_status(self) -> dict[str, Any]:
         """Get current stream status as a dictionary."""
-        safe_url = self._mask_rtsp_url(self.active_rtsp_url) if self.active_rtsp_url else ""
-
         return {
             "status": self.state.status.value,
             "uptime_seconds": self.uptime_seconds,
             "camera": {
                 "name": self._active_camera.name if self._active_camera else None,
-                "url": safe_url,
+                "url": self._masked_rtsp_url,
                 "connected": self.is_streaming,
                 "resolution": self.state.resolution,
                 "fps": self.state.fps,
@@ -794,8 +867,9 @@ class NetworkCameraDevice:
             logger.error("PTZ service not available")
             return False
 
-        # Validate direction
-        if direction not in PTZ_DIRECTIONS:
+        # Validate direction and get its multipliers in a single lookup
+        vector = PTZ_DIRECTIONS.get(direction)
+        if vector is None:
             logger.error("Invalid PTZ direction", direction=direction)
             return False
 
@@ -804,8 +878,7 @@ class NetworkCameraDevice:
         tilt_step = step if step is not None else self._active_camera.ptz_step
         zoom_step = step if step is not None else self._active_camera.ptz_zoom_step
 
-        # Get direction multipliers
-        pan_dir, tilt_dir, zoom_dir = PTZ_DIRECTIONS[direction]
+        pan_dir, tilt_dir, zoom_dir = vector
 
         # Calculate actual movement values
         pan = pan_dir * pan_step
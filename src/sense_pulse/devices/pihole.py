@@ -8,10 +8,16 @@ from tenacity import (
     wait_exponential,
 )
 
+from ..utils.serialization import loads
 from ..web.log_handler import get_structured_logger
 
 logger = get_structured_logger(__name__, component="pihole")
 
+# Stats are fetched by a single poller, so a tiny pool is enough. Idle
+# connections are kept longer than the default poll interval (30s) so each
+# poll reuses the previous TCP connection instead of reconnecting.
+HTTP_LIMITS = httpx.Limits(max_connections=2, max_keepalive_connections=1, keepalive_expiry=60.0)
+
 
 class PiHoleStats:
     """Handles fetching Pi-hole v6 statistics"""
@@ -33,7 +39,7 @@ class PiHoleStats:
     async def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure HTTP client is initialized"""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=5.0)
+            self._client = httpx.AsyncClient(timeout=5.0, limits=HTTP_LIMITS)
         return self._client
 
     async def close(self) -> None:
@@ -61,7 +67,7 @@ class PiHoleStats:
                 json={"password": self.password},
             )
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
 
             if data.get("session", {}).get("valid"):
                 self._session_id = data["session"].get("sid")
@@ -109,7 +115,7 @@ class PiHoleStats:
                 headers=self._get_headers(),
             )
             response.raise_for_status()
-            data: dict = response.json()
+            data: dict = loads(response.content)
             logger.debug("Successfully fetched Pi-hole stats", host=self.host)
             return data
 
@@ -1,6 +1,7 @@
 """Hardware abstraction - graceful degradation when Sense HAT unavailable"""
 
 import asyncio
+import time
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
@@ -20,6 +21,17 @@ _current_display_mode: str = "idle"
 _current_rotation: int = 0
 _web_rotation_offset: int = 90  # Default offset for web preview
 
+# Every /ws/grid client polls the matrix every 500ms; a snapshot younger than
+# this is shared between them so the hardware is read once per window rather
+# than once per connected client
+MATRIX_STATE_MAX_AGE = 0.25
+
+# Blank 8x8 frame returned when the hardware is unavailable; built once since
+# it is only ever serialized, never mutated
+_EMPTY_PIXELS: list[list[int]] = [[0, 0, 0] for _ in range(64)]
+_matrix_state: dict[str, Any] | None = None
+_matrix_state_time: float = 0.0
+
 
 def _init_sense_hat() -> None:
     """Lazy initialization of Sense HAT"""
@@ -184,7 +196,7 @@ def _get_matrix_state_sync() -> dict[str, Any]:
 
     # Hardware unavailable - return empty matrix
     return {
-        "pixels": [[0, 0, 0] for _ in range(64)],
+        "pixels": _EMPTY_PIXELS,
         "mode": _current_display_mode,
         "rotation": _current_rotation,
         "web_offset": _web_rotation_offset,
@@ -194,7 +206,14 @@ def _get_matrix_state_sync() -> dict[str, Any]:
 
 async def get_matrix_state() -> dict[str, Any]:
     """Get current LED matrix state for web preview (async wrapper)"""
-    return await asyncio.to_thread(_get_matrix_state_sync)
+    global _matrix_state, _matrix_state_time
+
+    if _matrix_state is not None and time.monotonic() - _matrix_state_time < MATRIX_STATE_MAX_AGE:
+        return _matrix_state
+
+    state = await asyncio.to_thread(_get_matrix_state_sync)
+    _matrix_state, _matrix_state_time = state, time.monotonic()
+    return state
 
 
 def set_web_rotation_offset(offset: int) -> None:
@@ -29,10 +29,9 @@ class SystemStats:
             cpu_temp = 0.0
             try:
                 temps = psutil.sensors_temperatures()
-                if "cpu_thermal" in temps:
-                    cpu_temp = temps["cpu_thermal"][0].current
-                elif "coretemp" in temps:
-                    cpu_temp = temps["coretemp"][0].current
+                sensor = temps.get("cpu_thermal") or temps.get("coretemp")
+                if sensor:
+                    cpu_temp = sensor[0].current
             except (AttributeError, KeyError, IndexError):
                 # Temperature sensors not available
                 pass
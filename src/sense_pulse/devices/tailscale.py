@@ -1,7 +1,7 @@
 """Tailscale connection status monitoring"""
 
 import asyncio
-import json
+import contextlib
 import time
 from typing import Any
 
@@ -12,6 +12,7 @@ from tenacity import (
     wait_exponential,
 )
 
+from ..utils.serialization import JSONDecodeError, loads
 from ..web.log_handler import get_structured_logger
 
 logger = get_structured_logger(__name__, component="tailscale")
@@ -40,7 +41,8 @@ class TailscaleStatus:
     )
     async def _fetch_status(self) -> dict | None:
         """Fetch Tailscale status data with caching (with retries)"""
-        current_time = time.time()
+        # Monotonic clock: only used for the cache interval, immune to wall-clock jumps
+        current_time = time.monotonic()
 
         # Return cached data if still valid
         if self._cached_data and (current_time - self._last_fetch) < self._cache_duration:
@@ -53,14 +55,25 @@ class TailscaleStatus:
                 "tailscale",
                 "status",
                 "--json",
+                # Only stdout is used; stderr was buffered and then thrown away
+                stdin=asyncio.subprocess.DEVNULL,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
 
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5.0)
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5.0)
+            except asyncio.TimeoutError:
+                # wait_for only cancels communicate(); kill and reap the hung CLI
+                # so each retry doesn't leave another process behind
+                with contextlib.suppress(ProcessLookupError):
+                    process.kill()
+                await process.wait()
+                raise
 
             if process.returncode == 0:
-                data: dict[Any, Any] = json.loads(stdout.decode())
+                # Parse the raw bytes directly; no intermediate str decode
+                data: dict[Any, Any] = loads(stdout)
                 self._cached_data = data
                 self._last_fetch = current_time
                 logger.debug("Successfully fetched Tailscale status")
@@ -75,23 +88,23 @@ class TailscaleStatus:
         except FileNotFoundError:
             logger.error("Tailscale command not found - is it installed?")
             return None
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             logger.error("Failed to parse Tailscale JSON output", error=str(e))
             return None
         except Exception as e:
             logger.error("Error checking Tailscale status", error=str(e))
             return None
 
-    async def is_connected(self) -> bool:
-        """Check if Tailscale is connected"""
-        status = await self._fetch_status()
+    @staticmethod
+    def _is_connected(status: dict | None) -> bool:
+        """Check a fetched status payload for an active connection"""
         if not status:
             return False
         return status.get("Self") is not None and status.get("BackendState") == "Running"
 
-    async def get_connected_device_count(self) -> int:
-        """Get count of connected Tailscale devices (peers)"""
-        status = await self._fetch_status()
+    @staticmethod
+    def _count_online_peers(status: dict | None) -> int:
+        """Count online peers in a fetched status payload"""
         if not status:
             logger.debug("No Tailscale status data, returning 0 devices")
             return 0
@@ -102,9 +115,19 @@ class TailscaleStatus:
         logger.debug("Tailscale device count", online=online_count, total_peers=len(peers))
         return online_count
 
+    async def is_connected(self) -> bool:
+        """Check if Tailscale is connected"""
+        return self._is_connected(await self._fetch_status())
+
+    async def get_connected_device_count(self) -> int:
+        """Get count of connected Tailscale devices (peers)"""
+        return self._count_online_peers(await self._fetch_status())
+
     async def get_status_summary(self) -> dict[str, Any]:
         """Get comprehensive Tailscale status summary"""
+        # Fetch once and derive both fields from the same snapshot
+        status = await self._fetch_status()
         return {
-            "connected": await self.is_connected(),
-            "device_count": await self.get_connected_device_count(),
+            "connected": self._is_connected(status),
+            "device_count": self._count_online_peers(status),
         }
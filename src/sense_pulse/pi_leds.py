@@ -19,6 +19,12 @@ LED_PATHS = {
     ],
 }
 
+# Triggers to restore when the original was never captured
+DEFAULT_TRIGGERS = {
+    "pwr": "default-on",
+    "act": "mmc0",  # Activity LED typically shows SD card activity
+}
+
 # Store original trigger values to restore later
 _original_triggers: dict[str, str] = {}
 
@@ -58,11 +64,15 @@ def _get_current_trigger(led_path: Path) -> str | None:
         return None
 
     # Trigger file format: "none mmc0 [heartbeat] default-on"
-    # The active trigger is in brackets
-    for part in content.split():
-        if part.startswith("[") and part.endswith("]"):
-            return part[1:-1]
-    return None
+    # The active trigger is in brackets; slice it out instead of splitting
+    # the whole (often long) trigger list into tokens
+    start = content.find("[")
+    if start == -1:
+        return None
+    end = content.find("]", start + 1)
+    if end == -1:
+        return None
+    return content[start + 1 : end]
 
 
 def is_pi_led_available() -> bool:
@@ -131,11 +141,7 @@ def enable_led(led_name: str) -> dict[str, str]:
             return {"status": "ok", "message": f"{led_name} LED restored to {original}"}
     else:
         # Use default triggers if we don't have original
-        default_triggers = {
-            "pwr": "default-on",
-            "act": "mmc0",  # Activity LED typically shows SD card activity
-        }
-        default = default_triggers.get(led_name, "default-on")
+        default = DEFAULT_TRIGGERS.get(led_name, "default-on")
         if _write_file(trigger_path, default):
             logger.info("Enabled LED with default trigger", led=led_name.upper(), trigger=default)
             return {"status": "ok", "message": f"{led_name} LED enabled with {default}"}
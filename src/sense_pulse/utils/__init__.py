@@ -1,5 +1,6 @@
 """Utility modules."""
 
 from .network import scan_network_for_port
+from .serialization import dumps, loads
 
-__all__ = ["scan_network_for_port"]
+__all__ = ["dumps", "loads", "scan_network_for_port"]
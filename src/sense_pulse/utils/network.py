@@ -3,13 +3,32 @@
 import asyncio
 import ipaddress
 import socket
+import weakref
 
 import psutil  # type: ignore[import-untyped]
 
+# Upper bound on simultaneous connection attempts (keeps file descriptors in check)
+MAX_SCAN_CONCURRENCY = 256
+
+# One limit per event loop shared by every scan, so overlapping scans (e.g. camera
+# discoveries with different timeouts) together stay under MAX_SCAN_CONCURRENCY
+_shared_limits: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_limit() -> asyncio.Semaphore:
+    """Get the scan-wide connection limit for the running event loop."""
+    loop = asyncio.get_running_loop()
+    limit = _shared_limits.get(loop)
+    if limit is None:
+        limit = _shared_limits[loop] = asyncio.Semaphore(MAX_SCAN_CONCURRENCY)
+    return limit
+
 
 async def scan_network_for_port(
     port: int,
-    max_concurrent: int = 100,
+    max_concurrent: int | None = None,
     timeout: float = 1.5,
 ) -> list[str]:
     """
@@ -17,7 +36,10 @@ async def scan_network_for_port(
 
     Args:
         port: Port number to scan for
-        max_concurrent: Max concurrent connection attempts
+        max_concurrent: Max concurrent connection attempts. Defaults to the number
+            of hosts in the network (capped at MAX_SCAN_CONCURRENCY), so a /24
+            is probed in a single wave instead of several timeout-bound rounds.
+            Concurrent scans also share one MAX_SCAN_CONCURRENCY budget.
         timeout: Timeout per connection attempt in seconds
 
     Returns:
@@ -27,11 +49,14 @@ async def scan_network_for_port(
     if not network:
         return []
 
-    semaphore = asyncio.Semaphore(max_concurrent)
     hosts = [str(ip) for ip in network.hosts()]
+    if max_concurrent is None:
+        max_concurrent = min(len(hosts), MAX_SCAN_CONCURRENCY) or 1
+    semaphore = asyncio.Semaphore(max_concurrent)
+    shared_limit = _shared_limit()
 
     async def check_host(host: str) -> str | None:
-        async with semaphore:
+        async with semaphore, shared_limit:
             try:
                 _, writer = await asyncio.wait_for(
                     asyncio.open_connection(host, port),
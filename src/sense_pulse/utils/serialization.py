@@ -0,0 +1,56 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is available and falls back to the standard library
+json module otherwise, so hot paths (log streaming, subprocess output
+parsing) can share a single fast encoder/decoder.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+# Both orjson.JSONDecodeError and json.JSONDecodeError subclass ValueError
+JSONDecodeError = ValueError
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        JSON encoded string
+
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Deserialize JSON from a string or bytes.
+
+    Args:
+        data: JSON document as str or bytes (bytes are parsed without decoding)
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
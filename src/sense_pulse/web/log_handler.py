@@ -1,8 +1,8 @@
 """WebSocket-based log handler for streaming logs to web clients."""
 
 import asyncio
-import json
 import logging
+import threading
 import traceback
 from collections import deque
 from collections.abc import MutableMapping
@@ -11,6 +11,8 @@ from typing import Any
 
 from fastapi import WebSocket
 
+from ..utils.serialization import dumps
+
 # =============================================================================
 # Structured Logging Helpers
 # =============================================================================
@@ -26,24 +28,25 @@ class StructuredLoggerAdapter(logging.LoggerAdapter):
         logger.error("Request failed", status_code=500, path="/api/data")
     """
 
+    # Keyword arguments understood by Logger._log; everything else is a field
+    LOGGING_KWARGS = frozenset({"exc_info", "stack_info", "stacklevel", "extra"})
+
     def process(
         self, msg: str, kwargs: MutableMapping[str, Any]
     ) -> tuple[str, MutableMapping[str, Any]]:
         """Process log message and extract extra fields."""
-        # Extract any extra kwargs that aren't standard logging kwargs
-        standard_kwargs = {"exc_info", "stack_info", "stacklevel", "extra"}
-        extra = kwargs.pop("extra", {})
-
-        # Move non-standard kwargs to extra
-        for key in list(kwargs.keys()):
-            if key not in standard_kwargs:
-                extra[key] = kwargs.pop(key)
+        extra = kwargs.pop("extra", None)
 
-        # Merge with adapter's extra
-        if self.extra:
-            extra = {**self.extra, **extra}
+        # Move non-standard kwargs out, keeping call order for rendering
+        fields = {
+            key: kwargs.pop(key) for key in [k for k in kwargs if k not in self.LOGGING_KWARGS]
+        }
 
-        kwargs["extra"] = extra
+        # Build the merged mapping in one pass: adapter defaults < explicit extra < fields
+        if self.extra or extra:
+            kwargs["extra"] = {**(self.extra or {}), **(extra or {}), **fields}
+        else:
+            kwargs["extra"] = fields
         return msg, kwargs
 
 
@@ -121,7 +124,7 @@ class StructuredFormatter(logging.Formatter):
         return message
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Represents a single log entry."""
 
@@ -173,10 +176,21 @@ class WebSocketLogHandler(logging.Handler):
             buffer_size: Maximum number of logs to keep in buffer
         """
         super().__init__(level)
+        # Copy-on-write: updates rebind a new set, so broadcasts can iterate the
+        # current one without snapshotting it first
         self._clients: set[WebSocket] = set()
         self._buffer: deque[LogEntry] = deque(maxlen=buffer_size)
         self._lock = asyncio.Lock()
+        # Log bursts schedule one broadcast per record; only one sends at a time
+        # so clients receive entries in order and sends don't pile up per socket
+        self._broadcast_lock = asyncio.Lock()
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        # Entries emitted since the last flush; a burst is sent by one flush task
+        # instead of scheduling a coroutine per record. Guarded by the handler lock.
+        self._pending: list[LogEntry] = []
+        self._flush_scheduled = False
+        self._flush_task: asyncio.Task | None = None
 
         # Set a simple formatter
         self.setFormatter(logging.Formatter("%(message)s"))
@@ -196,11 +210,46 @@ class WebSocketLogHandler(logging.Handler):
 
             # Broadcast to clients if we have any
             if self._clients and self._loop:
-                # Schedule the broadcast in the event loop
-                asyncio.run_coroutine_threadsafe(self._broadcast_log(entry), self._loop)
+                self._pending.append(entry)
+                if not self._flush_scheduled:
+                    # Only the first record of a burst wakes the event loop
+                    self._flush_scheduled = True
+                    try:
+                        if threading.get_ident() == self._loop_thread_id:
+                            # Already on the loop thread: start the flush task right
+                            # away instead of via a callback that then creates it
+                            self._flush_task = self._loop.create_task(self._flush_pending())
+                        else:
+                            self._loop.call_soon_threadsafe(self._start_flush)
+                    except RuntimeError:
+                        # Loop closed; drop the batch rather than wedge future flushes
+                        self._pending.clear()
+                        self._flush_scheduled = False
+                        raise
         except Exception:
             self.handleError(record)
 
+    def _start_flush(self) -> None:
+        """Start the flush task (runs on the event loop thread)."""
+        self._flush_task = asyncio.ensure_future(self._flush_pending())
+
+    async def _flush_pending(self) -> None:
+        """Broadcast every entry queued since the last flush, in order."""
+        self.acquire()
+        try:
+            entries, self._pending = self._pending, []
+            self._flush_scheduled = False
+        finally:
+            self.release()
+
+        if len(entries) == 1:
+            await self._broadcast_log(entries[0])
+        elif entries:
+            # A burst goes out as one frame per client instead of one send per entry
+            await self._broadcast_messages(
+                [dumps({"type": "logs", "data": [entry.to_dict() for entry in entries]})]
+            )
+
     def _create_log_entry(self, record: logging.LogRecord) -> LogEntry:
         """Create a LogEntry from a LogRecord."""
         exc_info = None
@@ -208,7 +257,6 @@ class WebSocketLogHandler(logging.Handler):
             exc_info = "".join(traceback.format_exception(*record.exc_info))
 
         # Extract any extra fields that were added to the log record
-        extra = {}
         standard_attrs = {
             "name",
             "msg",
@@ -234,12 +282,15 @@ class WebSocketLogHandler(logging.Handler):
             "asctime",
             "taskName",
         }
-        for key, value in record.__dict__.items():
-            if key not in standard_attrs:
+        extra = {key: value for key, value in record.__dict__.items() if key not in standard_attrs}
+        # Check serializability with one encode of the whole mapping; only when
+        # that fails fall back to checking (and stringifying) values one by one
+        try:
+            dumps(extra)
+        except (TypeError, ValueError):
+            for key, value in extra.items():
                 try:
-                    # Ensure the value is JSON serializable
-                    json.dumps(value)
-                    extra[key] = value
+                    dumps(value)
                 except (TypeError, ValueError):
                     extra[key] = str(value)
 
@@ -258,21 +309,26 @@ class WebSocketLogHandler(logging.Handler):
 
     async def _broadcast_log(self, entry: LogEntry) -> None:
         """Broadcast a log entry to all connected clients."""
+        await self._broadcast_messages([dumps({"type": "log", "data": entry.to_dict()})])
+
+    async def _broadcast_messages(self, messages: list[str]) -> None:
+        """Send encoded messages, in order, to all connected clients."""
         if not self._clients:
             return
 
-        message = json.dumps({"type": "log", "data": entry.to_dict()})
-
-        # Send to all clients, removing any that fail
-        disconnected = set()
-        for client in self._clients:
-            try:
-                await client.send_text(message)
-            except Exception:
-                disconnected.add(client)
+        async with self._broadcast_lock:
+            # Send to all clients, removing any that fail
+            disconnected = set()
+            for client in self._clients:
+                try:
+                    for message in messages:
+                        await client.send_text(message)
+                except Exception:
+                    disconnected.add(client)
 
-        # Remove disconnected clients
-        self._clients -= disconnected
+            # Remove disconnected clients
+            if disconnected:
+                self._clients = self._clients - disconnected
 
     async def register_client(self, websocket: WebSocket) -> None:
         """
@@ -282,9 +338,10 @@ class WebSocketLogHandler(logging.Handler):
             websocket: The WebSocket connection to register
         """
         async with self._lock:
-            self._clients.add(websocket)
+            self._clients = self._clients | {websocket}
             # Store the event loop for broadcasting from sync context
             self._loop = asyncio.get_event_loop()
+            self._loop_thread_id = threading.get_ident()
 
     async def unregister_client(self, websocket: WebSocket) -> None:
         """
@@ -294,7 +351,7 @@ class WebSocketLogHandler(logging.Handler):
             websocket: The WebSocket connection to unregister
         """
         async with self._lock:
-            self._clients.discard(websocket)
+            self._clients = self._clients - {websocket}
 
     def get_buffer(self, min_level: int = logging.DEBUG) -> list[dict[str, Any]]:
         """
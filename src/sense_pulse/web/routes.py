@@ -13,6 +13,8 @@ from pydantic import BaseModel
 
 from sense_pulse.context import AppContext
 from sense_pulse.devices import sensehat
+from sense_pulse.devices.network_camera import PTZ_DIRECTIONS
+from sense_pulse.utils.serialization import dumps, loads
 from sense_pulse.web.app import get_context
 from sense_pulse.web.auth import require_auth
 from sense_pulse.web.log_handler import get_structured_logger, setup_websocket_logging
@@ -23,16 +25,56 @@ if TYPE_CHECKING:
 logger = get_structured_logger(__name__, component="routes")
 router = APIRouter()
 
+# Cache keys rendered on the dashboard and pushed to status clients
+STATUS_CACHE_KEYS = ("tailscale", "pihole", "system", "sensors", "co2", "weather")
+
+# Valid display rotations (degrees)
+VALID_ROTATIONS = frozenset({0, 90, 180, 270})
+
+# String values accepted as true for boolean config fields
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "on"})
+
+
+def _as_bool(value: Any) -> bool:
+    """
+    Convert a JSON config value to bool.
+
+    Strings are matched against a fixed set of true literals so that
+    form-style values like "false" or "0" are not treated as truthy.
+
+    Args:
+        value: Raw value from the request body
+
+    Returns:
+        Parsed boolean
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_STRINGS
+    return bool(value)
+
 
 # Helper functions for Aranet4 DataSource access
-async def _is_aranet4_available(context: AppContext) -> bool:
-    """Check if Aranet4 sensors are available (configured and have data)"""
+async def _is_aranet4_available(
+    context: AppContext, co2_data: dict[str, Any] | None = None
+) -> bool:
+    """
+    Check if Aranet4 sensors are available (configured and have data).
+
+    Args:
+        context: Application context
+        co2_data: CO2 cache entry the caller already read; fetched from the
+            cache when omitted
+
+    Returns:
+        True if a sensor is enabled and CO2 data is cached
+    """
     config = context.config
     # Check if any sensors are configured
     if not any(s.enabled for s in config.aranet4.sensors):
         return False
     # Check if cache has CO2 data
-    co2_data = await context.cache.get("co2", {})
+    if co2_data is None:
+        co2_data = await context.cache.get("co2", {})
     return bool(co2_data)
 
 
@@ -102,25 +144,20 @@ async def index(
 
     # Convert aranet4 sensors to dicts for JSON serialization
     aranet4_sensors_dict = [asdict(sensor) for sensor in config.aranet4.sensors]
+    cached = await cache.get_many(STATUS_CACHE_KEYS, {}, with_source_status=True)
 
     return templates.TemplateResponse(
         "index.html",
         {
             "request": request,
             "sense_hat_available": sensehat.is_sense_hat_available(),
-            "aranet4_available": await _is_aranet4_available(context),
+            "aranet4_available": await _is_aranet4_available(context, cached["co2"]),
             "network_camera_enabled": config.network_camera.enabled,
             "config": config,
             "aranet4_sensors": aranet4_sensors_dict,
             "network_camera_cameras": config.network_camera.cameras,
-            "tailscale": await cache.get("tailscale", {}),
-            "pihole": await cache.get("pihole", {}),
-            "system": await cache.get("system", {}),
-            "sensors": await cache.get("sensors", {}),
-            "co2": await cache.get("co2", {}),
-            "weather": await cache.get("weather", {}),
+            **cached,
             "aranet4_status": await _get_aranet4_status(context),
-            "datasource_status": cache.get_all_source_status(),
         },
     )
 
@@ -132,18 +169,13 @@ async def get_status(
 ) -> dict[str, Any]:
     """Get all status data as JSON (from cache) - requires authentication"""
     config = context.config
-    cache = context.cache
+    cached = await context.cache.get_many(STATUS_CACHE_KEYS, {})
 
     return {
-        "tailscale": await cache.get("tailscale", {}),
-        "pihole": await cache.get("pihole", {}),
-        "system": await cache.get("system", {}),
-        "sensors": await cache.get("sensors", {}),
-        "co2": await cache.get("co2", {}),
-        "weather": await cache.get("weather", {}),
+        **cached,
         "hardware": {
             "sense_hat_available": sensehat.is_sense_hat_available(),
-            "aranet4_available": await _is_aranet4_available(context),
+            "aranet4_available": await _is_aranet4_available(context, cached["co2"]),
         },
         "config": {
             "show_icons": config.display.show_icons,
@@ -166,20 +198,15 @@ async def get_status_cards(request: Request, context: AppContext = Depends(get_c
     """HTMX partial: status cards grid (from cache)"""
     config = context.config
     templates = request.app.state.templates
-    cache = context.cache
+    cached = await context.cache.get_many(STATUS_CACHE_KEYS, {})
 
     return templates.TemplateResponse(
         "partials/status_cards.html",
         {
             "request": request,
-            "tailscale": await cache.get("tailscale", {}),
-            "pihole": await cache.get("pihole", {}),
-            "system": await cache.get("system", {}),
-            "sensors": await cache.get("sensors", {}),
-            "co2": await cache.get("co2", {}),
-            "weather": await cache.get("weather", {}),
+            **cached,
             "sense_hat_available": sensehat.is_sense_hat_available(),
-            "aranet4_available": await _is_aranet4_available(context),
+            "aranet4_available": await _is_aranet4_available(context, cached["co2"]),
             "config": config,
         },
     )
@@ -240,7 +267,8 @@ async def grid_websocket(websocket: WebSocket):
                 },
             }
 
-            await websocket.send_json(data)
+            # Encode with the fast codec rather than send_json's stdlib json
+            await websocket.send_text(dumps(data))
             await asyncio.sleep(0.5)  # Update every 500ms for smooth matrix animation
     except WebSocketDisconnect:
         pass
@@ -250,7 +278,7 @@ async def grid_websocket(websocket: WebSocket):
 
 @router.websocket("/ws/sensors")
 async def sensors_websocket(websocket: WebSocket):
-    """WebSocket endpoint for sensor data (slower updates - 30s)"""
+    """WebSocket endpoint for sensor data (pushed after each cache poll, at least every 30s)"""
     await websocket.accept()
 
     # Get context from app.state for WebSocket handlers
@@ -260,23 +288,17 @@ async def sensors_websocket(websocket: WebSocket):
     try:
         while True:
             # Gather all sensor data (each sensor has value and timestamp embedded)
-            data = {
-                "tailscale": await cache.get("tailscale", {}),
-                "pihole": await cache.get("pihole", {}),
-                "system": await cache.get("system", {}),
-                "sensors": await cache.get("sensors", {}),
-                "co2": await cache.get("co2", {}),
-                "weather": await cache.get("weather", {}),
-                "datasource_status": cache.get_all_source_status(),
-            }
+            data = await cache.get_many(STATUS_CACHE_KEYS, {}, with_source_status=True)
 
             # Include network camera status if available
             network_camera_device = _get_network_camera_device(context)
             if network_camera_device:
                 data["network_camera"] = network_camera_device.get_status()
 
-            await websocket.send_json(data)
-            await asyncio.sleep(30)  # Update every 30s since sensor data updates slowly
+            await websocket.send_text(dumps(data))
+            # Push as soon as the next poll lands; resend after 30s regardless
+            # so camera status still refreshes if polling stalls
+            await cache.wait_for_update(timeout=30)
     except WebSocketDisconnect:
         pass
     except Exception:
@@ -414,7 +436,7 @@ async def update_config_endpoint(
 
     try:
         # Parse JSON body
-        body = await request.json()
+        body = loads(await request.body())
 
         # Build updates dict with validation
         updates: dict[str, Any] = {}
@@ -425,12 +447,12 @@ async def update_config_endpoint(
 
             if "rotation" in display_updates:
                 rotation = int(display_updates["rotation"])
-                if rotation in [0, 90, 180, 270]:
+                if rotation in VALID_ROTATIONS:
                     updates["display"]["rotation"] = rotation
                     await sensehat.set_rotation(rotation)
 
             if "show_icons" in display_updates:
-                updates["display"]["show_icons"] = bool(display_updates["show_icons"])
+                updates["display"]["show_icons"] = _as_bool(display_updates["show_icons"])
 
             if "scroll_speed" in display_updates:
                 updates["display"]["scroll_speed"] = display_updates["scroll_speed"]
@@ -440,7 +462,7 @@ async def update_config_endpoint(
 
             if "web_rotation_offset" in display_updates:
                 offset = int(display_updates["web_rotation_offset"])
-                if offset in [0, 90, 180, 270]:
+                if offset in VALID_ROTATIONS:
                     updates["display"]["web_rotation_offset"] = offset
                     sensehat.set_web_rotation_offset(offset)
 
@@ -455,7 +477,7 @@ async def update_config_endpoint(
                 updates["sleep"]["end_hour"] = sleep_updates["end_hour"]
 
             if "disable_pi_leds" in sleep_updates:
-                updates["sleep"]["disable_pi_leds"] = bool(sleep_updates["disable_pi_leds"])
+                updates["sleep"]["disable_pi_leds"] = _as_bool(sleep_updates["disable_pi_leds"])
 
         if "cache" in body:
             cache_updates = body["cache"]
@@ -482,7 +504,7 @@ async def update_config_endpoint(
             updates["weather"] = {}
 
             if "enabled" in weather_updates:
-                updates["weather"]["enabled"] = bool(weather_updates["enabled"])
+                updates["weather"]["enabled"] = _as_bool(weather_updates["enabled"])
                 logger.warning(
                     "Weather data source enabled/disabled. Please restart the application for changes to take effect."
                 )
@@ -560,11 +582,11 @@ async def get_aranet4_status_endpoint(
     context: AppContext = Depends(get_context),
 ) -> dict[str, Any]:
     """Get Aranet4 sensor status and readings"""
-    cache = context.cache
+    co2_data = await context.cache.get("co2", {})
     return {
         "status": await _get_aranet4_status(context),
-        "data": await cache.get("co2", {}),
-        "available": await _is_aranet4_available(context),
+        "data": co2_data,
+        "available": await _is_aranet4_available(context, co2_data),
     }
 
 
@@ -588,7 +610,7 @@ async def update_aranet4_config(
 
     try:
         # Parse JSON body with list of sensors
-        body = await request.json()
+        body = loads(await request.body())
         sensors = body.get("sensors", [])
 
         # Update config via context (writes to disk and reloads)
@@ -758,7 +780,7 @@ async def update_network_camera_config(
 
     try:
         # Parse JSON body with list of cameras
-        body = await request.json()
+        body = loads(await request.body())
         new_cameras = body.get("cameras", [])
 
         # Merge with existing cameras to preserve fields the UI doesn't manage
@@ -912,12 +934,11 @@ async def ptz_move(
     if not device:
         return {"success": False, "message": "Network camera not configured"}
 
-    # Validate direction
-    valid_directions = {"up", "down", "left", "right", "zoomin", "zoomout"}
-    if request.direction not in valid_directions:
+    # Validate direction against the device's direction table
+    if request.direction not in PTZ_DIRECTIONS:
         return {
             "success": False,
-            "message": f"Invalid direction. Must be one of: {', '.join(valid_directions)}",
+            "message": f"Invalid direction. Must be one of: {', '.join(PTZ_DIRECTIONS)}",
         }
 
     try:
@@ -1,6 +1,7 @@
 """Tests for Aranet4 BLE device and sensor classes"""
 
 import asyncio
+import dataclasses
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -10,6 +11,27 @@ from sense_pulse.datasources.aranet4_source import Aranet4DataSource
 from sense_pulse.devices.aranet4 import Aranet4Device, Aranet4Reading, Aranet4Sensor
 
 
+def fake_scanner(advertisements: list) -> type:
+    """Build a stand-in for aranet4.client.Aranet4Scanner that replays advertisements"""
+
+    class FakeScanner:
+        instances: list["FakeScanner"] = []
+
+        def __init__(self, on_scan):
+            self.on_scan = on_scan
+            self.stopped = False
+            FakeScanner.instances.append(self)
+
+        async def start(self) -> None:
+            for advertisement in advertisements:
+                self.on_scan(advertisement)
+
+        async def stop(self) -> None:
+            self.stopped = True
+
+    return FakeScanner
+
+
 class TestAranet4Device:
     """Test Aranet4Device class"""
 
@@ -62,11 +84,8 @@ class TestAranet4Device:
             ago=10,
         )
 
-        async def mock_find_nearby(callback, duration):
-            callback(mock_advertisement)
-
-        with patch("aranet4.client._find_nearby", new=mock_find_nearby):
-            results = await device.read_all_sensors()
+        with patch("aranet4.client.Aranet4Scanner", fake_scanner([mock_advertisement])):
+            results = await device.read_all_sensors(duration=0.05)
 
         assert results["office"] is not None
         assert results["office"].co2 == 800
@@ -76,6 +95,82 @@ class TestAranet4Device:
         assert results["office"].battery == 90
         assert results["bedroom"] is None  # not found in scan
 
+    @pytest.mark.asyncio
+    async def test_read_all_sensors_stops_once_all_found(self):
+        """read_all_sensors ends the scan early when every sensor has reported"""
+        device = Aranet4Device()
+        device.add_sensor("office", Aranet4Sensor("AA:BB:CC:DD:EE:FF", "office"))
+
+        mock_advertisement = Mock()
+        mock_advertisement.device.address = "aa:bb:cc:dd:ee:ff"
+        mock_advertisement.readings = Mock(
+            co2=650, temperature=21.0, humidity=40, pressure=1000.0, battery=80, interval=60, ago=5
+        )
+        scanner_cls = fake_scanner([mock_advertisement])
+
+        with patch("aranet4.client.Aranet4Scanner", scanner_cls):
+            results = await asyncio.wait_for(device.read_all_sensors(duration=30), timeout=1)
+
+        assert results["office"].co2 == 650
+        assert scanner_cls.instances[0].stopped is True
+
+    @pytest.mark.asyncio
+    async def test_read_all_sensors_shares_scan_timestamp(self):
+        """Every reading from one scan carries the same timestamp"""
+        device = Aranet4Device()
+        device.add_sensor("office", Aranet4Sensor("AA:BB:CC:DD:EE:FF", "office"))
+        device.add_sensor("bedroom", Aranet4Sensor("11:22:33:44:55:66", "bedroom"))
+
+        advertisements = []
+        for address in ("AA:BB:CC:DD:EE:FF", "11:22:33:44:55:66"):
+            advertisement = Mock()
+            advertisement.device.address = address
+            advertisement.readings = Mock(
+                co2=650,
+                temperature=21.0,
+                humidity=40,
+                pressure=1000.0,
+                battery=80,
+                interval=60,
+                ago=5,
+            )
+            advertisements.append(advertisement)
+
+        with (
+            patch("aranet4.client.Aranet4Scanner", fake_scanner(advertisements)),
+            patch("sense_pulse.devices.aranet4.time.time", side_effect=[100.0, 200.0, 300.0]),
+        ):
+            results = await device.read_all_sensors(duration=1)
+
+        assert results["office"].timestamp == 100.0
+        assert results["bedroom"].timestamp == 100.0
+
+    @pytest.mark.asyncio
+    async def test_read_all_sensors_keeps_first_advertisement(self):
+        """Repeat advertisements from a sensor don't replace its first reading"""
+        device = Aranet4Device()
+        device.add_sensor("office", Aranet4Sensor("AA:BB:CC:DD:EE:FF", "office"))
+
+        advertisements = []
+        for co2 in (700, 900):
+            advertisement = Mock()
+            advertisement.device.address = "AA:BB:CC:DD:EE:FF"
+            advertisement.readings = Mock(
+                co2=co2,
+                temperature=21.0,
+                humidity=40,
+                pressure=1000.0,
+                battery=80,
+                interval=60,
+                ago=5,
+            )
+            advertisements.append(advertisement)
+
+        with patch("aranet4.client.Aranet4Scanner", fake_scanner(advertisements)):
+            results = await device.read_all_sensors(duration=0.05)
+
+        assert results["office"].co2 == 700
+
     @pytest.mark.asyncio
     async def test_read_all_sensors_handles_import_error(self):
         """read_all_sensors returns empty results on ImportError"""
@@ -83,31 +178,76 @@ class TestAranet4Device:
         sensor = Aranet4Sensor("AA:BB:CC:DD:EE:FF", "office")
         device.add_sensor("office", sensor)
 
-        with (
-            patch.dict("sys.modules", {"aranet4": None}),
-            patch(
-                "sense_pulse.devices.aranet4.Aranet4Device.read_all_sensors",
-                new_callable=AsyncMock,
-                return_value={"office": None},
-            ),
-        ):
+        with patch("sense_pulse.devices.aranet4.aranet4", None):
             results = await device.read_all_sensors()
-            assert results["office"] is None
+
+        assert results == {"office": None}
 
     @pytest.mark.asyncio
     async def test_scan_for_devices_returns_empty_on_import_error(self):
         """scan_for_devices returns empty list if aranet4 not installed"""
         device = Aranet4Device()
 
-        with (
-            patch.dict("sys.modules", {"aranet4": None}),
-            patch(
-                "sense_pulse.devices.aranet4.Aranet4Device.scan_for_devices",
-                return_value=[],
-            ),
-        ):
+        with patch("sense_pulse.devices.aranet4.aranet4", None):
             result = await device.scan_for_devices()
-            assert result == []
+
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_scan_for_devices_reports_each_device_once(self):
+        """scan_for_devices lists each address once, with readings when advertised"""
+        device = Aranet4Device()
+
+        with_readings = Mock(rssi=-60)
+        with_readings.device.address = "aa:bb:cc:dd:ee:ff"
+        with_readings.device.name = "Aranet4 Office"
+        with_readings.readings = Mock(co2=700, temperature=21.5, humidity=45)
+        without_readings = Mock(rssi=-80, readings=None)
+        without_readings.device.address = "11:22:33:44:55:66"
+        without_readings.device.name = None
+
+        async def mock_find_nearby(callback, duration):
+            for advertisement in (with_readings, with_readings, without_readings):
+                callback(advertisement)
+
+        with patch("aranet4.client._find_nearby", new=mock_find_nearby):
+            devices = await device.scan_for_devices(duration=1)
+
+        assert devices == [
+            {
+                "name": "Aranet4 Office",
+                "address": "AA:BB:CC:DD:EE:FF",
+                "rssi": -60,
+                "co2": 700,
+                "temperature": 21.5,
+                "humidity": 45,
+            },
+            {"name": "Aranet4", "address": "11:22:33:44:55:66", "rssi": -80},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_scans_share_one_ble_scan(self):
+        """Concurrent scan_for_devices callers await a single BLE scan"""
+        device = Aranet4Device()
+        calls = 0
+
+        async def fake_scan(duration: int) -> list[dict]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return [{"name": "Aranet4", "address": "AA:BB:CC:DD:EE:FF", "rssi": -60}]
+
+        with patch.object(device, "_scan_for_devices", fake_scan):
+            scans = [device.scan_for_devices(duration=10) for _ in range(3)]
+            results = await asyncio.gather(*scans)
+            assert calls == 1
+            assert all(r[0]["address"] == "AA:BB:CC:DD:EE:FF" for r in results)
+
+            # Once finished, the next call starts a fresh scan
+            await device.scan_for_devices(duration=10)
+            assert calls == 2
+
+        assert device._scan_tasks == {}
 
 
 class TestAranet4Sensor:
@@ -161,6 +301,23 @@ class TestAranet4Reading:
         # timestamp not included in to_dict
         assert "timestamp" not in result
 
+    def test_is_immutable_and_slotted(self):
+        """Readings are frozen and carry no per-instance __dict__"""
+        reading = Aranet4Reading(
+            co2=800,
+            temperature=22.5,
+            humidity=50,
+            pressure=1013.0,
+            battery=90,
+            interval=300,
+            ago=10,
+            timestamp=1234567890.0,
+        )
+
+        assert not hasattr(reading, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            reading.co2 = 900  # type: ignore[misc]
+
 
 class TestAranet4DataSource:
     """Test Aranet4DataSource class"""
@@ -224,6 +381,27 @@ class TestAranet4DataSource:
         assert "office" in device.sensors
         assert "disabled" not in device.sensors
 
+    @pytest.mark.asyncio
+    async def test_get_metadata_cached_until_initialize(self):
+        """get_metadata() reuses one instance and refreshes after initialize()"""
+        config = Aranet4Config(
+            sensors=[
+                Aranet4SensorConfig(label="office", mac_address="AA:BB:CC:DD:EE:FF", enabled=True)
+            ]
+        )
+        device = Aranet4Device()
+        source = Aranet4DataSource(config, device)
+
+        before = source.get_metadata()
+        assert source.get_metadata() is before
+        assert "none" in before.description
+
+        await source.initialize()
+
+        after = source.get_metadata()
+        assert after is not before
+        assert "office (1 configured)" in after.description
+
     @pytest.mark.asyncio
     async def test_fetch_readings_returns_empty_when_disabled(self):
         """fetch_readings() returns empty list when disabled"""
@@ -235,6 +413,44 @@ class TestAranet4DataSource:
 
         assert readings == []
 
+    @pytest.mark.asyncio
+    async def test_fetch_readings_skips_missing_sensors(self):
+        """fetch_readings() returns one reading per sensor found in the scan"""
+        config = Aranet4Config(
+            sensors=[
+                Aranet4SensorConfig(label="office", mac_address="AA:BB:CC:DD:EE:FF", enabled=True),
+                Aranet4SensorConfig(label="bedroom", mac_address="11:22:33:44:55:66", enabled=True),
+            ]
+        )
+        device = Aranet4Device()
+        source = Aranet4DataSource(config, device)
+        await source.initialize()
+        reading = Aranet4Reading(
+            co2=800,
+            temperature=22.5,
+            humidity=50,
+            pressure=1013.0,
+            battery=90,
+            interval=300,
+            ago=10,
+            timestamp=1234567890.0,
+        )
+
+        with patch.object(
+            device, "read_all_sensors", AsyncMock(return_value={"office": reading, "bedroom": None})
+        ):
+            readings = await source.fetch_readings()
+
+        assert [r.sensor_id for r in readings] == ["office"]
+        assert readings[0].value == {
+            "temperature": 22.5,
+            "co2": 800,
+            "humidity": 50,
+            "pressure": 1013.0,
+            "battery": 90,
+        }
+        assert readings[0].unit is None
+
     def test_get_sensor_status(self):
         """get_sensor_status() returns config info from device sensors"""
         config = Aranet4Config(sensors=[])
@@ -14,28 +14,31 @@ from sense_pulse.web.auth import (
     verify_password,
 )
 
+SECURE_PASSWORD = "secure_password"
+
+
+@pytest.fixture(scope="module")
+def secure_password_hash() -> str:
+    """Bcrypt hash of SECURE_PASSWORD, computed once for the module (hashing is slow)"""
+    return get_password_hash(SECURE_PASSWORD)
+
 
 class TestPasswordHashing:
     """Test password hashing functions"""
 
-    def test_hash_and_verify_password(self):
+    def test_hash_and_verify_password(self, secure_password_hash):
         """Test password hashing and verification"""
-        password = "test_password_123"
-        hashed = get_password_hash(password)
+        assert secure_password_hash != SECURE_PASSWORD
+        assert verify_password(SECURE_PASSWORD, secure_password_hash) is True
+        assert verify_password("wrong_password", secure_password_hash) is False
 
-        assert hashed != password
-        assert verify_password(password, hashed) is True
-        assert verify_password("wrong_password", hashed) is False
-
-    def test_hash_produces_different_hashes(self):
+    def test_hash_produces_different_hashes(self, secure_password_hash):
         """Test that same password produces different hashes (salt)"""
-        password = "test_password"
-        hash1 = get_password_hash(password)
-        hash2 = get_password_hash(password)
+        rehashed = get_password_hash(SECURE_PASSWORD)
 
-        assert hash1 != hash2
-        assert verify_password(password, hash1) is True
-        assert verify_password(password, hash2) is True
+        assert rehashed != secure_password_hash
+        assert verify_password(SECURE_PASSWORD, secure_password_hash) is True
+        assert verify_password(SECURE_PASSWORD, rehashed) is True
 
 
 class TestAuthConfig:
@@ -90,32 +93,23 @@ class TestAuthenticateUser:
         # Should always succeed when disabled
         assert authenticate_user("any", "password") is True
 
-    def test_authenticate_with_valid_credentials(self):
+    def test_authenticate_with_valid_credentials(self, secure_password_hash):
         """Test authentication with valid credentials"""
-        password = "secure_password"
-        hashed = get_password_hash(password)
-
-        config = AuthConfig(enabled=True, username="admin", password_hash=hashed)
+        config = AuthConfig(enabled=True, username="admin", password_hash=secure_password_hash)
         set_auth_config(config)
 
-        assert authenticate_user("admin", password) is True
+        assert authenticate_user("admin", SECURE_PASSWORD) is True
 
-    def test_authenticate_with_invalid_username(self):
+    def test_authenticate_with_invalid_username(self, secure_password_hash):
         """Test authentication with wrong username"""
-        password = "secure_password"
-        hashed = get_password_hash(password)
-
-        config = AuthConfig(enabled=True, username="admin", password_hash=hashed)
+        config = AuthConfig(enabled=True, username="admin", password_hash=secure_password_hash)
         set_auth_config(config)
 
-        assert authenticate_user("wrong_user", password) is False
+        assert authenticate_user("wrong_user", SECURE_PASSWORD) is False
 
-    def test_authenticate_with_invalid_password(self):
+    def test_authenticate_with_invalid_password(self, secure_password_hash):
         """Test authentication with wrong password"""
-        password = "secure_password"
-        hashed = get_password_hash(password)
-
-        config = AuthConfig(enabled=True, username="admin", password_hash=hashed)
+        config = AuthConfig(enabled=True, username="admin", password_hash=secure_password_hash)
         set_auth_config(config)
 
         assert authenticate_user("admin", "wrong_password") is False
@@ -134,25 +128,19 @@ class TestRequireAuth:
 
         assert result == "anonymous"
 
-    def test_require_auth_with_valid_credentials(self):
+    def test_require_auth_with_valid_credentials(self, secure_password_hash):
         """Test require_auth with valid credentials"""
-        password = "secure_password"
-        hashed = get_password_hash(password)
-
-        config = AuthConfig(enabled=True, username="admin", password_hash=hashed)
+        config = AuthConfig(enabled=True, username="admin", password_hash=secure_password_hash)
         set_auth_config(config)
 
-        credentials = HTTPBasicCredentials(username="admin", password=password)
+        credentials = HTTPBasicCredentials(username="admin", password=SECURE_PASSWORD)
         result = require_auth(credentials)
 
         assert result == "admin"
 
-    def test_require_auth_with_invalid_credentials(self):
+    def test_require_auth_with_invalid_credentials(self, secure_password_hash):
         """Test require_auth raises exception with invalid credentials"""
-        password = "secure_password"
-        hashed = get_password_hash(password)
-
-        config = AuthConfig(enabled=True, username="admin", password_hash=hashed)
+        config = AuthConfig(enabled=True, username="admin", password_hash=secure_password_hash)
         set_auth_config(config)
 
         credentials = HTTPBasicCredentials(username="admin", password="wrong")
@@ -3,6 +3,7 @@
 import asyncio
 import time
 from datetime import datetime
+from unittest.mock import patch
 
 from sense_pulse.cache import CachedData, DataCache
 from sense_pulse.datasources.base import SensorReading
@@ -18,6 +19,12 @@ class TestCachedData:
         assert data.is_expired(ttl=5) is True
         assert data.is_expired(ttl=15) is False
 
+    def test_is_expired_with_explicit_now(self):
+        """Test expiration checking against a caller-supplied clock reading"""
+        data = CachedData(data="test", timestamp=100.0)
+        assert data.is_expired(ttl=5, now=104.0) is False
+        assert data.is_expired(ttl=5, now=106.0) is True
+
     def test_age(self):
         """Test age calculation"""
         start = time.time()
@@ -61,6 +68,34 @@ class TestDataCache:
         assert "key2" in all_data
         assert all_data["key1"] == "value1"
 
+    async def test_get_many(self):
+        """Test getting several keys at once"""
+        cache = DataCache(cache_ttl=1.0)
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        cache._cache["stale"] = CachedData("old", timestamp=time.time() - 10)
+
+        result = await cache.get_many(["key1", "key2", "stale", "missing"], default={})
+
+        assert result == {"key1": "value1", "key2": "value2", "stale": {}, "missing": {}}
+
+    async def test_get_many_with_source_status(self):
+        """Test source status is returned alongside data from the same read"""
+        cache = DataCache()
+        source = MockDataSource(source_id="test_source", name="Test Source")
+        await source.initialize()
+        cache.register_data_source(source)
+        await cache._poll_data_source(source)
+
+        result = await cache.get_many(["test_source"], with_source_status=True)
+
+        assert result["test_source"] is not None
+        assert result["datasource_status"] == [
+            {**status, "age": result["datasource_status"][0]["age"]}
+            for status in cache.get_all_source_status()
+        ]
+        assert result["datasource_status"][0]["success"] is True
+
     async def test_register_source(self):
         """Test registering a data source"""
         cache = DataCache()
@@ -84,6 +119,20 @@ class TestDataCache:
         assert result["test"]["value"] == "data"
         assert "timestamp" in result["test"]
 
+    async def test_polling_reuses_registered_metadata(self):
+        """Test that polling uses metadata captured at registration"""
+        cache = DataCache(poll_interval=10.0)
+        source = MockDataSource(source_id="meta_source")
+        await source.initialize()
+        cache.register_data_source(source)
+
+        with patch.object(source, "get_metadata", wraps=source.get_metadata) as get_metadata:
+            await cache.start_polling()
+            await cache.stop_polling()
+
+        get_metadata.assert_not_called()
+        assert await cache.get("meta_source") is not None
+
     async def test_poll_data_source_error(self):
         """Test polling handles errors gracefully"""
         cache = DataCache()
@@ -208,8 +257,7 @@ class TestCachePolling:
         cache.register_data_source(source)
         await cache.start_polling()
 
-        # Should do immediate poll
-        await asyncio.sleep(0.1)
+        # start_polling() awaits the immediate poll before returning
         assert source.get_fetch_count() > 0
 
         await cache.stop_polling()
@@ -227,8 +275,8 @@ class TestCachePolling:
         cache.register_data_source(source)
         await cache.start_polling()
 
-        # Wait for multiple polls
-        await asyncio.sleep(0.5)
+        # Wait for the first interval poll after the immediate one
+        assert await cache.wait_for_update(timeout=2.0) is True
 
         await cache.stop_polling()
 
@@ -237,6 +285,65 @@ class TestCachePolling:
         assert data is not None
         assert source.get_fetch_count() >= 2  # At least immediate poll + 1 interval
 
+    async def test_start_polling_fetches_each_source_once(self):
+        """Test that startup does a single poll per source, not one per loop and start"""
+        cache = DataCache(poll_interval=10.0)
+        source = MockDataSource(source_id="once", name="Once")
+        await source.initialize()
+
+        cache.register_data_source(source)
+        await cache.start_polling()
+        await asyncio.sleep(0.05)  # Let the loop task run its first step
+        await cache.stop_polling()
+
+        assert source.get_fetch_count() == 1
+
+    async def test_poll_all_sources_runs_concurrently(self):
+        """Test that one slow source doesn't hold up the others in a cycle"""
+        cache = DataCache()
+        active = 0
+        max_active = 0
+
+        class SlowSource(MockDataSource):
+            async def fetch_readings(self) -> list[SensorReading]:
+                nonlocal active, max_active
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.05)
+                active -= 1
+                return await super().fetch_readings()
+
+        for source_id in ("a", "b", "c"):
+            cache.register_data_source(SlowSource(source_id=source_id))
+
+        await cache._poll_all_sources()
+
+        assert max_active == 3
+        for source_id in ("a", "b", "c"):
+            assert await cache.get(source_id) is not None
+
+    async def test_wait_for_update_wakes_after_poll_cycle(self):
+        """Test that waiters are released once a poll cycle completes"""
+        cache = DataCache(poll_interval=10.0)
+        source = MockDataSource(source_id="waited", name="Waited")
+        await source.initialize()
+        cache.register_data_source(source)
+
+        waiter = asyncio.create_task(cache.wait_for_update(timeout=5))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await cache._poll_all_sources()
+
+        assert await waiter is True
+        assert await cache.get("waited") is not None
+
+    async def test_wait_for_update_times_out(self):
+        """Test that wait_for_update reports a timeout when no poll happens"""
+        cache = DataCache(poll_interval=10.0)
+
+        assert await cache.wait_for_update(timeout=0.01) is False
+
     async def test_start_polling_when_already_running(self):
         """Test that starting polling twice doesn't create duplicate tasks"""
         cache = DataCache(poll_interval=1.0)
@@ -274,14 +381,14 @@ class TestCachePolling:
         cache.register_data_source(source)
         await cache.start_polling()
 
-        # Wait for multiple poll cycles
-        await asyncio.sleep(0.6)
+        # Wait for two interval polls after the immediate one
+        assert await cache.wait_for_update(timeout=2.0) is True
+        assert await cache.wait_for_update(timeout=2.0) is True
 
         await cache.stop_polling()
 
-        # Should have polled at least 3 times (immediate + 2 intervals)
-        # Give some leeway for timing
-        assert source.get_fetch_count() >= 2
+        # Immediate poll + 2 intervals
+        assert source.get_fetch_count() >= 3
 
     async def test_cache_ttl_preserved_in_status(self):
         """Test that cache TTL is reported correctly in status"""
@@ -15,6 +15,8 @@ from sense_pulse.config import (
     WeatherConfig,
     find_config_file,
     load_config,
+    parse_config,
+    read_config_data,
 )
 
 
@@ -189,6 +191,36 @@ class TestConfigLoading:
         finally:
             Path(config_path).unlink()
 
+    def test_parse_config_from_dict(self):
+        """Test building config from already-loaded data without touching disk"""
+        config = parse_config({"display": {"rotation": 180}, "web": {"port": 9000}})
+
+        assert config.display.rotation == 180
+        assert config.web.port == 9000
+        assert config.pihole.host == "http://localhost"  # Default
+
+    def test_read_config_data_matches_safe_load(self):
+        """Test the fast loader yields the same mapping as yaml.safe_load"""
+        data = {"display": {"rotation": 90, "show_icons": False}, "web": {"port": 8080}}
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump(data, f)
+            config_path = Path(f.name)
+
+        try:
+            assert read_config_data(config_path) == yaml.safe_load(config_path.read_text())
+        finally:
+            config_path.unlink()
+
+    def test_read_config_data_empty_file(self):
+        """Test an empty config file reads as an empty mapping"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            config_path = Path(f.name)
+
+        try:
+            assert read_config_data(config_path) == {}
+        finally:
+            config_path.unlink()
+
     def test_find_config_file(self):
         """Test finding config file in standard locations"""
         # Create temp config in current directory
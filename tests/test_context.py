@@ -1,8 +1,11 @@
 """Tests for AppContext module."""
 
+import asyncio
+
 import pytest
 
-from sense_pulse.config import Config
+from sense_pulse.cache import DataCache
+from sense_pulse.config import Config, load_config
 from sense_pulse.context import AppContext
 from tests.mock_datasource import MockDataSource
 
@@ -94,6 +97,26 @@ class TestAppContextLifecycle:
         assert not context.is_started
         assert source.is_shutdown()
 
+    @pytest.mark.asyncio
+    async def test_shutdown_continues_past_failing_source(self):
+        """Test a source failing to shut down doesn't block the others."""
+
+        class FailingShutdownSource(MockDataSource):
+            async def shutdown(self) -> None:
+                raise RuntimeError("Mock shutdown failure")
+
+        config = Config()
+        context = AppContext.create(config, poll_interval=10.0)
+        context.add_data_source(FailingShutdownSource(source_id="broken"))
+        source = MockDataSource(source_id="ok")
+        context.add_data_source(source)
+
+        await context.start()
+        await context.shutdown()
+
+        assert not context.is_started
+        assert source.is_shutdown()
+
     @pytest.mark.asyncio
     async def test_start_handles_source_failure(self):
         """Test start() continues if a source fails to initialize."""
@@ -119,6 +142,33 @@ class TestAppContextLifecycle:
         finally:
             await context.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_start_initializes_sources_concurrently(self):
+        """Test start() overlaps source initialization and keeps registration order."""
+        active = 0
+        max_active = 0
+
+        class SlowInitSource(MockDataSource):
+            async def initialize(self) -> None:
+                nonlocal active, max_active
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.05)
+                active -= 1
+                await super().initialize()
+
+        config = Config()
+        context = AppContext.create(config, poll_interval=10.0)
+        for source_id in ("a", "b", "c"):
+            context.add_data_source(SlowInitSource(source_id=source_id))
+
+        await context.start()
+        try:
+            assert max_active == 3
+            assert context.cache.list_registered_sources() == ["a", "b", "c"]
+        finally:
+            await context.shutdown()
+
     @pytest.mark.asyncio
     async def test_double_start_is_noop(self):
         """Test calling start() twice is safe."""
@@ -181,6 +231,13 @@ class TestAppContextHelpers:
 
         assert found is source
 
+    def test_get_data_source_passed_to_constructor(self):
+        """Test get_data_source finds sources passed directly to the constructor."""
+        source = MockDataSource(source_id="direct", name="Direct")
+        context = AppContext(config=Config(), cache=DataCache(), data_sources=[source])
+
+        assert context.get_data_source("direct") is source
+
     def test_get_data_source_not_found(self):
         """Test get_data_source returns None for unknown ID."""
         config = Config()
@@ -190,6 +247,31 @@ class TestAppContextHelpers:
 
         assert found is None
 
+    def test_update_config_persists_and_applies(self, tmp_path):
+        """Test update_config writes merged data and returns the updated config."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("display:\n  rotation: 0\n  show_icons: true\n")
+        context = AppContext.create(Config(), config_path=config_path)
+
+        config = context.update_config({"display": {"rotation": 90}})
+
+        assert config is context.config
+        assert config.display.rotation == 90
+        assert config.display.show_icons is True
+        assert load_config(str(config_path)).display.rotation == 90
+
+    def test_update_config_adds_missing_section(self, tmp_path):
+        """Test update_config creates sections absent from the file."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("display:\n  rotation: 0\n")
+        context = AppContext.create(Config(), config_path=config_path)
+
+        config = context.update_config({"sleep": {"start_hour": 23}})
+
+        assert config.sleep.start_hour == 23
+        assert config.display.rotation == 0
+        assert load_config(str(config_path)).sleep.start_hour == 23
+
     def test_repr(self):
         """Test string representation."""
         config = Config()
@@ -1,7 +1,7 @@
 """Tests for data source architecture"""
 
-import asyncio
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -51,6 +51,15 @@ class TestMockDataSource:
         assert metadata.name == "Test Source"
         assert metadata.enabled is True
 
+    def test_metadata_is_immutable(self):
+        """Test metadata cannot be modified once built"""
+        import dataclasses
+
+        metadata = MockDataSource(source_id="test").get_metadata()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            metadata.enabled = False  # type: ignore[misc]
+
     @pytest.mark.asyncio
     async def test_health_check(self):
         """Test health check"""
@@ -116,6 +125,22 @@ class TestDataSourceRegistry:
         registry.register(source1)
         with pytest.raises(ValueError, match="already registered"):
             registry.register(source2)
+        # The first registration is kept
+        assert registry.get("test1") is source1
+
+    @pytest.mark.asyncio
+    async def test_reregistering_same_source_is_noop(self):
+        """Test that registering the same instance again is accepted without logging"""
+        registry = DataSourceRegistry()
+        source = MockDataSource(source_id="test1")
+        registry.register(source)
+
+        with patch("sense_pulse.datasources.registry.logger") as logger:
+            registry.register(source)
+
+        logger.info.assert_not_called()
+        assert len(registry) == 1
+        assert registry.get("test1") is source
 
     @pytest.mark.asyncio
     async def test_get_source(self):
@@ -225,8 +250,8 @@ class TestCacheIntegration:
         # Start polling
         await cache.start_polling()
 
-        # Wait for at least one poll cycle
-        await asyncio.sleep(0.6)
+        # Wait for at least one interval poll cycle
+        assert await cache.wait_for_update(timeout=2.0) is True
 
         # Check that data was fetched
         assert source.get_fetch_count() >= 1
@@ -0,0 +1,219 @@
+"""Tests for the WebSocket log handler."""
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+from sense_pulse.utils.serialization import loads
+from sense_pulse.web.log_handler import WebSocketLogHandler, get_structured_logger
+
+
+class SlowClient:
+    """Fake WebSocket that records sends and tracks overlapping sends."""
+
+    def __init__(self):
+        self.messages: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def send_text(self, message: str) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0)
+        self.messages.append(message)
+        self.active -= 1
+
+
+def make_record(message: str) -> logging.LogRecord:
+    """Build a plain INFO log record."""
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+class TestBroadcast:
+    """Test broadcasting log entries to clients."""
+
+    async def test_broadcasts_are_serialized_in_order(self):
+        """Concurrent broadcasts never overlap and keep submission order."""
+        handler = WebSocketLogHandler()
+        client = SlowClient()
+        handler._clients.add(client)
+
+        entries = [handler._create_log_entry(make_record(f"msg {i}")) for i in range(5)]
+        await asyncio.gather(*(handler._broadcast_log(entry) for entry in entries))
+
+        assert client.max_active == 1
+        assert [f"msg {i}" in m for i, m in enumerate(client.messages)] == [True] * 5
+
+    async def test_failed_client_is_removed(self):
+        """Clients whose send raises are dropped."""
+
+        class BrokenClient:
+            async def send_text(self, message: str) -> None:
+                raise RuntimeError("closed")
+
+        handler = WebSocketLogHandler()
+        broken = BrokenClient()
+        handler._clients.add(broken)
+
+        await handler._broadcast_log(handler._create_log_entry(make_record("hello")))
+
+        assert handler.client_count == 0
+
+    async def test_unregister_during_broadcast(self):
+        """Clients leaving mid-broadcast don't disturb the in-progress send."""
+        handler = WebSocketLogHandler()
+        first, second = SlowClient(), SlowClient()
+        handler._clients.add(first)
+        handler._clients.add(second)
+
+        broadcast = asyncio.create_task(
+            handler._broadcast_log(handler._create_log_entry(make_record("hello")))
+        )
+        await asyncio.sleep(0)
+        await handler.unregister_client(second)
+        await broadcast
+
+        assert handler.client_count == 1
+        assert len(first.messages) + len(second.messages) == 2
+
+
+class TestCreateLogEntry:
+    """Test conversion of log records to entries."""
+
+    def test_serializable_extras_kept_as_is(self):
+        """JSON-friendly extra fields pass through unchanged."""
+        handler = WebSocketLogHandler()
+        record = make_record("hello")
+        record.component = "cache"
+        record.count = 3
+        record.tags = ["a", "b"]
+
+        entry = handler._create_log_entry(record)
+
+        assert entry.extra == {"component": "cache", "count": 3, "tags": ["a", "b"]}
+
+    def test_unserializable_extras_stringified(self):
+        """Only values that cannot be encoded are converted to strings."""
+        handler = WebSocketLogHandler()
+        record = make_record("hello")
+        record.component = "cache"
+        record.obj = object()
+
+        entry = handler._create_log_entry(record)
+
+        assert entry.extra["component"] == "cache"
+        assert isinstance(entry.extra["obj"], str)
+        assert entry.extra["obj"].startswith("<object object")
+
+
+class TestEmitCoalescing:
+    """Test batching of emitted records into a single flush."""
+
+    async def test_burst_is_flushed_once_in_order(self):
+        """A burst of records schedules one flush that sends all of them."""
+        handler = WebSocketLogHandler()
+        client = SlowClient()
+        handler._clients.add(client)
+        handler._loop = asyncio.get_running_loop()
+
+        with patch.object(handler, "_flush_pending", wraps=handler._flush_pending) as flush_pending:
+            for i in range(10):
+                handler.handle(make_record(f"msg {i}"))
+
+            # Let the scheduled callback start the flush task, then let it finish
+            await asyncio.sleep(0)
+            await handler._flush_task
+
+        assert flush_pending.call_count == 1
+        assert len(client.messages) == 1
+        batch = loads(client.messages[0])
+        assert batch["type"] == "logs"
+        assert [entry["message"] for entry in batch["data"]] == [f"msg {i}" for i in range(10)]
+        assert handler._pending == []
+        assert handler._flush_scheduled is False
+
+    async def test_loop_thread_emit_skips_threadsafe_wakeup(self):
+        """Records logged on the loop thread schedule the flush directly."""
+        handler = WebSocketLogHandler()
+        client = SlowClient()
+        await handler.register_client(client)
+        loop = asyncio.get_running_loop()
+
+        with patch.object(loop, "call_soon_threadsafe") as threadsafe:
+            handler.handle(make_record("local"))
+            await asyncio.sleep(0)
+            await handler._flush_task
+
+        threadsafe.assert_not_called()
+        assert len(client.messages) == 1
+
+    async def test_loop_thread_emit_starts_flush_task_immediately(self):
+        """On the loop thread the flush task exists as soon as the record is handled."""
+        handler = WebSocketLogHandler()
+        client = SlowClient()
+        await handler.register_client(client)
+
+        handler.handle(make_record("first"))
+        flush_task = handler._flush_task
+        assert flush_task is not None and not flush_task.done()
+
+        # Records emitted before the task runs still join the same batch
+        handler.handle(make_record("second"))
+        assert handler._flush_task is flush_task
+        await flush_task
+
+        assert len(client.messages) == 1
+        assert [entry["message"] for entry in loads(client.messages[0])["data"]] == [
+            "first",
+            "second",
+        ]
+
+    async def test_worker_thread_emit_wakes_loop(self):
+        """Records logged from another thread still reach clients."""
+        handler = WebSocketLogHandler()
+        client = SlowClient()
+        await handler.register_client(client)
+
+        await asyncio.to_thread(handler.handle, make_record("threaded"))
+        await asyncio.sleep(0)
+        await handler._flush_task
+
+        assert len(client.messages) == 1
+        assert "threaded" in client.messages[0]
+
+    async def test_no_flush_without_clients(self):
+        """Records are only buffered when nobody is connected."""
+        handler = WebSocketLogHandler()
+        handler._loop = asyncio.get_running_loop()
+
+        handler.handle(make_record("quiet"))
+
+        assert handler._pending == []
+        assert handler._flush_scheduled is False
+        assert handler.get_buffer()[-1]["message"] == "quiet"
+
+
+class TestStructuredLoggerAdapter:
+    """Test moving keyword arguments into structured extras."""
+
+    def test_fields_merged_over_defaults(self):
+        """Call kwargs override explicit extra, which overrides adapter defaults."""
+        adapter = get_structured_logger("test", component="cache", key="default")
+
+        msg, kwargs = adapter.process(
+            "hello",
+            {"extra": {"key": "explicit", "other": 1}, "key": "field", "exc_info": True},
+        )
+
+        assert msg == "hello"
+        assert kwargs["exc_info"] is True
+        assert kwargs["extra"] == {"component": "cache", "key": "field", "other": 1}
+
+    def test_field_order_preserved(self):
+        """Fields keep call order so rendered extras are stable."""
+        adapter = get_structured_logger("test")
+
+        _, kwargs = adapter.process("hello", {"b": 2, "a": 1, "stacklevel": 2})
+
+        assert list(kwargs["extra"]) == ["b", "a"]
+        assert kwargs["stacklevel"] == 2
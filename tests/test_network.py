@@ -0,0 +1,42 @@
+"""Tests for network scanning utilities"""
+
+import asyncio
+import ipaddress
+from unittest.mock import patch
+
+from sense_pulse.utils import network
+from sense_pulse.utils.network import scan_network_for_port
+
+
+class TestScanNetworkForPort:
+    """Test scan_network_for_port"""
+
+    async def test_concurrent_scans_share_connection_limit(self):
+        """Overlapping scans together never exceed MAX_SCAN_CONCURRENCY attempts"""
+        active = 0
+        max_active = 0
+
+        async def fake_open_connection(host: str, port: int):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            raise ConnectionRefusedError
+
+        with (
+            patch.object(network, "MAX_SCAN_CONCURRENCY", 3),
+            patch.object(
+                network,
+                "_get_local_network",
+                return_value=ipaddress.IPv4Network("10.0.0.0/29"),
+            ),
+            patch("asyncio.open_connection", fake_open_connection),
+        ):
+            results = await asyncio.gather(
+                scan_network_for_port(554, max_concurrent=3),
+                scan_network_for_port(8554, max_concurrent=3),
+            )
+
+        assert results == [[], []]
+        assert max_active == 3
@@ -96,3 +96,63 @@ class TestRoutesPublicAPIUsage:
         assert (
             "get_data_source_status" in source_code
         ), "_get_aranet4_status should use get_data_source_status()"
+
+
+class TestConfigValueParsing:
+    """Test parsing of config update values."""
+
+    def test_as_bool_accepts_json_booleans(self):
+        """Real booleans and numbers pass through bool()."""
+        from sense_pulse.web.routes import _as_bool
+
+        assert _as_bool(True) is True
+        assert _as_bool(False) is False
+        assert _as_bool(1) is True
+        assert _as_bool(0) is False
+
+    def test_as_bool_parses_strings(self):
+        """String literals are matched instead of using truthiness."""
+        from sense_pulse.web.routes import _as_bool
+
+        assert _as_bool("true") is True
+        assert _as_bool(" Yes ") is True
+        assert _as_bool("on") is True
+        assert _as_bool("false") is False
+        assert _as_bool("0") is False
+        assert _as_bool("") is False
+
+
+class TestAranet4Availability:
+    """Test the Aranet4 availability helper."""
+
+    @pytest.mark.asyncio
+    async def test_uses_supplied_co2_data_without_cache_read(self):
+        """Callers that already read the cache pass the CO2 entry through."""
+        from unittest.mock import AsyncMock
+
+        from sense_pulse.config import Aranet4SensorConfig, Config
+        from sense_pulse.context import AppContext
+        from sense_pulse.web.routes import _is_aranet4_available
+
+        config = Config()
+        config.aranet4.sensors = [Aranet4SensorConfig(label="Office", enabled=True)]
+        context = AppContext(config=config, cache=DataCache())
+        context.cache.get = AsyncMock(return_value={})
+
+        assert await _is_aranet4_available(context, {"Office": {"co2": 800}}) is True
+        assert await _is_aranet4_available(context, {}) is False
+        context.cache.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_cache_read(self):
+        """Without supplied data the helper reads the CO2 cache entry."""
+        from sense_pulse.config import Aranet4SensorConfig, Config
+        from sense_pulse.context import AppContext
+        from sense_pulse.web.routes import _is_aranet4_available
+
+        config = Config()
+        config.aranet4.sensors = [Aranet4SensorConfig(label="Office", enabled=True)]
+        context = AppContext(config=config, cache=DataCache())
+        await context.cache.set("co2", {"Office": {"co2": 800}})
+
+        assert await _is_aranet4_available(context) is True
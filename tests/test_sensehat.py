@@ -0,0 +1,53 @@
+"""Tests for Sense HAT hardware helpers"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sense_pulse.devices import sensehat
+from sense_pulse.devices.sensehat import MATRIX_STATE_MAX_AGE, get_matrix_state
+
+
+@pytest.fixture(autouse=True)
+def reset_matrix_state(monkeypatch):
+    """Start each test without a cached matrix snapshot and restore it afterwards"""
+    monkeypatch.setattr(sensehat, "_matrix_state", None)
+    monkeypatch.setattr(sensehat, "_matrix_state_time", 0.0)
+
+
+class TestMatrixStateCache:
+    """Test the shared matrix snapshot used by /ws/grid clients"""
+
+    async def test_reuses_snapshot_within_max_age(self):
+        """A second call inside the window returns the snapshot without reading again"""
+        state = {"pixels": [], "available": False}
+        read = AsyncMock(return_value=state)
+
+        with (
+            patch("sense_pulse.devices.sensehat.asyncio.to_thread", read),
+            patch("sense_pulse.devices.sensehat.time.monotonic") as monotonic,
+        ):
+            monotonic.side_effect = [100.0, 100.0 + MATRIX_STATE_MAX_AGE / 2]
+            first = await get_matrix_state()
+            second = await get_matrix_state()
+
+        assert first is state
+        assert second is state
+        read.assert_awaited_once()
+
+    async def test_reads_hardware_again_after_expiry(self):
+        """A call after the window has passed takes a fresh snapshot"""
+        stale = {"pixels": [], "available": False}
+        fresh = {"pixels": [[255, 0, 0]] * 64, "available": True}
+        read = AsyncMock(side_effect=[stale, fresh])
+
+        with (
+            patch("sense_pulse.devices.sensehat.asyncio.to_thread", read),
+            patch("sense_pulse.devices.sensehat.time.monotonic") as monotonic,
+        ):
+            # Stored at 100.0, checked and re-stored once the window has expired
+            monotonic.side_effect = [100.0, 100.0 + MATRIX_STATE_MAX_AGE, 100.5]
+            assert await get_matrix_state() is stale
+            assert await get_matrix_state() is fresh
+
+        assert read.await_count == 2
@@ -0,0 +1,38 @@
+"""Tests for JSON serialization helpers"""
+
+import pytest
+
+from sense_pulse.utils.serialization import JSONDecodeError, dumps, loads
+
+
+class TestSerialization:
+    """Test dumps/loads helpers"""
+
+    def test_roundtrip(self):
+        """Test that dumps output can be loaded back"""
+        data = {"type": "log", "data": {"level": "INFO", "line": 42, "extra": None}}
+        assert loads(dumps(data)) == data
+
+    def test_dumps_returns_compact_str(self):
+        """Test that dumps returns a compact string"""
+        result = dumps({"a": 1, "b": [1, 2]})
+        assert isinstance(result, str)
+        assert " " not in result
+
+    def test_dumps_non_str_keys(self):
+        """Test that non-string dict keys are serialized like stdlib json"""
+        assert loads(dumps({1: "one"})) == {"1": "one"}
+
+    def test_dumps_unserializable_raises_type_error(self):
+        """Test that unserializable objects raise TypeError"""
+        with pytest.raises(TypeError):
+            dumps(object())
+
+    def test_loads_bytes(self):
+        """Test that bytes are parsed without decoding first"""
+        assert loads(b'{"Self": {"Online": true}}') == {"Self": {"Online": True}}
+
+    def test_loads_invalid_raises(self):
+        """Test that invalid JSON raises JSONDecodeError"""
+        with pytest.raises(JSONDecodeError):
+            loads(b"not json")
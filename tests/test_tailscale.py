@@ -0,0 +1,85 @@
+"""Tests for Tailscale status checker"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from sense_pulse.devices.tailscale import TailscaleStatus
+
+STATUS = {
+    "Self": {"HostName": "pi"},
+    "BackendState": "Running",
+    "Peer": {
+        "a": {"Online": True},
+        "b": {"Online": False},
+        "c": {"Online": True},
+    },
+}
+
+
+class TestTailscaleStatus:
+    """Test TailscaleStatus class"""
+
+    async def test_status_summary_fetches_once(self):
+        """get_status_summary derives both fields from a single fetch"""
+        status = TailscaleStatus()
+        with patch.object(status, "_fetch_status", AsyncMock(return_value=STATUS)) as fetch:
+            summary = await status.get_status_summary()
+
+        assert summary == {"connected": True, "device_count": 2}
+        fetch.assert_awaited_once()
+
+    async def test_status_summary_without_data(self):
+        """get_status_summary reports disconnected when status is unavailable"""
+        status = TailscaleStatus()
+        with patch.object(status, "_fetch_status", AsyncMock(return_value=None)):
+            summary = await status.get_status_summary()
+
+        assert summary == {"connected": False, "device_count": 0}
+
+    async def test_is_connected_requires_running_backend(self):
+        """is_connected is False when backend is not running"""
+        status = TailscaleStatus()
+        stopped = {**STATUS, "BackendState": "Stopped"}
+        with patch.object(status, "_fetch_status", AsyncMock(return_value=stopped)):
+            assert await status.is_connected() is False
+
+    async def test_fetch_status_parses_raw_stdout(self):
+        """_fetch_status parses the subprocess output bytes"""
+        status = TailscaleStatus()
+        process = AsyncMock()
+        process.returncode = 0
+        process.communicate.return_value = (b'{"BackendState": "Running", "Self": {}}', b"")
+
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)):
+            data = await status._fetch_status()
+
+        assert data == {"BackendState": "Running", "Self": {}}
+
+    async def test_fetch_status_invalid_json_returns_none(self):
+        """_fetch_status returns None when output isn't valid JSON"""
+        status = TailscaleStatus()
+        process = AsyncMock()
+        process.returncode = 0
+        process.communicate.return_value = (b"not json", b"")
+
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)):
+            assert await status._fetch_status() is None
+
+    async def test_fetch_status_timeout_kills_process(self):
+        """A hung tailscale CLI is killed and reaped before the timeout propagates"""
+        status = TailscaleStatus()
+        process = AsyncMock()
+        process.kill = Mock()
+        process.communicate.side_effect = asyncio.TimeoutError
+
+        with (
+            patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)),
+            pytest.raises(asyncio.TimeoutError),
+        ):
+            # Call past the retry decorator so the test doesn't sit through backoff
+            await TailscaleStatus._fetch_status.__wrapped__(status)
+
+        process.kill.assert_called_once()
+        process.wait.assert_awaited_once()
@@ -78,10 +78,7 @@ class TestWebAppCreation:
             app = create_app(context=context)
             client = TestClient(app)
 
-            # Give cache time to populate
-            import asyncio
-
-            await asyncio.sleep(0.2)
+            # context.start() already ran the immediate cache poll
 
             response = client.get("/api/sensors")
 
@@ -150,3 +147,83 @@ class TestGetContextDependency:
             assert isinstance(response.json(), list)
         finally:
             await context.shutdown()
+
+
+class TestConfigEndpoint:
+    """Test configuration update endpoint."""
+
+    def test_update_config_parses_body(self, tmp_path):
+        """Test POST /api/config applies updates from the JSON body."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("display:\n  show_icons: true\n")
+        context = AppContext.create(Config(), config_path=config_path)
+        client = TestClient(create_app(context=context))
+
+        response = client.post(
+            "/api/config",
+            content=b'{"display": {"show_icons": "false"}, "sleep": {"disable_pi_leds": true}}',
+            headers={"Content-Type": "application/json"},
+            auth=("admin", "unused"),  # Auth is disabled but Basic credentials are required
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["config"]["show_icons"] is False
+        assert data["config"]["disable_pi_leds"] is True
+
+    def test_update_config_rejects_invalid_json(self, tmp_path):
+        """Test POST /api/config reports an error for a malformed body."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("display:\n  show_icons: true\n")
+        context = AppContext.create(Config(), config_path=config_path)
+        client = TestClient(create_app(context=context))
+
+        response = client.post("/api/config", content=b"{not json", auth=("admin", "unused"))
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "error"
+
+
+class TestPTZMoveEndpoint:
+    """Test PTZ move endpoint validation."""
+
+    def test_invalid_direction_rejected_without_device_call(self):
+        """Test unknown directions are rejected before reaching the device."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        context = AppContext.create(Config())
+        device = MagicMock()
+        device.ptz_move = AsyncMock(return_value=True)
+        context.network_camera_device = device
+        client = TestClient(create_app(context=context))
+
+        response = client.post(
+            "/api/network-camera/ptz/move",
+            json={"direction": "sideways"},
+            auth=("admin", "unused"),
+        )
+
+        data = response.json()
+        assert data["success"] is False
+        assert "up, down, left, right, zoomin, zoomout" in data["message"]
+        device.ptz_move.assert_not_called()
+
+    def test_valid_direction_forwarded_to_device(self):
+        """Test known directions are passed to the device."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        context = AppContext.create(Config())
+        device = MagicMock()
+        device.ptz_move = AsyncMock(return_value=True)
+        context.network_camera_device = device
+        client = TestClient(create_app(context=context))
+
+        response = client.post(
+            "/api/network-camera/ptz/move",
+            json={"direction": "zoomin", "step": 0.2},
+            auth=("admin", "unused"),
+        )
+
+        assert response.json()["success"] is True
+        device.ptz_move.assert_awaited_once_with("zoomin", 0.2)